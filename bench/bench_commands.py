@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for the controller's commands against the fake Spotify server.
+
+Every COMMANDS entry (one per command, aliases skipped) is driven
+non-interactively with scripted answers to its prompts. The benchmark
+reports p50/p95 wall time, HTTP requests and bytes transferred per run.
+Caches start cold in a temporary HOME, so the first run of each command
+pays the uncached cost.
+
+Example:
+    python bench/bench_commands.py --playlists 20 --tracks 2000 --latency-ms 40 --iterations 10
+    python bench/bench_commands.py --json results.json
+    python bench/bench_commands.py --baseline results.json --tolerance 0.25
+"""
+import argparse
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+
+# Scripted answers for each command's console.input prompts.
+SCRIPTS = {
+    "next": [],
+    "prev": [],
+    "pause": [],
+    "show": [],
+    "volume": ["40"],
+    "shuffle": [],
+    "repeat": [],
+    "queue": [],
+    "add": ["summer night", "0"],
+    "track": ["blue river", "1"],
+    "showlists": [],
+    "showlist": ["0", "q"],
+    "playlist": ["1"],
+    "createlist": ["bench", "", "n"],
+    "addtolist": ["2", "gold star", "0"],
+    "removefromlist": ["2", "q", "0"],
+    "synclib": [],
+    "help": [],
+    "stats": [""],
+}
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_controller(server):
+    """
+    Import the controller with a temporary HOME and point it at the fake server.
+
+    Returns:
+        module: The imported spotify_controller module.
+    """
+    home = tempfile.mkdtemp(prefix="spotuify-bench-")
+    os.environ["HOME"] = home
+    os.environ["USERPROFILE"] = home
+    # Coalesced commands would be sent after the command returns, outside its measurement.
+    os.environ.setdefault("SPOTUIFY_COALESCE_WINDOW", "0")
+    # The fake server has no rate limit; throttling would only measure the token bucket.
+    os.environ.setdefault("SPOTUIFY_RATE_LIMIT", "0")
+    sys.path.insert(0, str(SRC_DIR))
+
+    import spotipy
+    import spotify_controller as sc
+    from metrics import TimedConsole
+    from transport import add_listener, build_session
+
+    client = spotipy.Spotify(auth="bench-token", requests_session=build_session(pool_size=sc.HTTP_POOL_SIZE))
+    client.prefix = server.base_url
+    add_listener(sc.metrics.on_transport_event)
+    add_listener(sc.scheduler.on_transport_event)
+    sc.sp = sc.LazySpotify(lambda: client, wrap=sc.wrap_client_method)
+    # Background refreshes would add requests that no command asked for.
+    sc.playback_state.start = lambda: None
+    sc.prefetcher.idle = lambda: None
+
+    class ScriptedConsole(TimedConsole):
+        answers = []
+
+        def input(self, prompt="", **kwargs):
+            self.print(prompt, end="")
+            return self.answers.pop(0) if self.answers else ""
+
+    sc.console = ScriptedConsole(file=io.StringIO(), width=120)
+    return sc
+
+
+def run_benchmark(sc, server, commands, iterations: int):
+    """
+    Run each command `iterations` times and collect latency and traffic.
+
+    Returns:
+        dict: Per-command results keyed by command name.
+    """
+    results = {}
+    for name in commands:
+        durations, requests, bytes_moved = [], [], []
+        for _ in range(iterations):
+            sc.console.answers = list(SCRIPTS.get(name, []))
+            sc.console.file = io.StringIO()
+            before = server.snapshot()
+            start = time.perf_counter()
+            sc.run_command(name)
+            durations.append((time.perf_counter() - start) * 1000)
+            after = server.snapshot()
+            requests.append(after["requests"] - before["requests"])
+            bytes_moved.append(after["bytes_in"] + after["bytes_out"] - before["bytes_in"] - before["bytes_out"])
+        results[name] = {
+            "runs": iterations,
+            "p50_ms": round(percentile(durations, 50), 2),
+            "p95_ms": round(percentile(durations, 95), 2),
+            "first_ms": round(durations[0], 2),
+            "requests_per_run": round(sum(requests) / iterations, 2),
+            "bytes_per_run": round(sum(bytes_moved) / iterations),
+        }
+    return results
+
+
+def print_results(results, console):
+    from rich.table import Table
+
+    table = Table(title="Command Latency")
+    table.add_column("Command", style="bold green")
+    table.add_column("p50 (ms)", style="cyan", justify="right")
+    table.add_column("p95 (ms)", style="cyan", justify="right")
+    table.add_column("First (ms)", style="yellow", justify="right")
+    table.add_column("Requests/run", justify="right")
+    table.add_column("KB/run", justify="right")
+    for name, r in results.items():
+        table.add_row(name, f"{r['p50_ms']:.1f}", f"{r['p95_ms']:.1f}", f"{r['first_ms']:.1f}",
+                      f"{r['requests_per_run']:.1f}", f"{r['bytes_per_run'] / 1024:.1f}")
+    console.print(table)
+
+
+def compare(results, baseline, tolerance: float):
+    """
+    Return (command, metric, baseline, current) tuples that regressed beyond the tolerance.
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ("p50_ms", "p95_ms", "requests_per_run", "bytes_per_run"):
+            if current[metric] > base[metric] * (1 + tolerance) and current[metric] - base[metric] > 1:
+                regressions.append((name, metric, base[metric], current[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark spotify_controller commands against a fake API")
+    parser.add_argument("--playlists", type=int, default=20)
+    parser.add_argument("--tracks", type=int, default=1000, help="tracks per playlist")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--commands", help="comma-separated subset of commands to run")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results to compare against; exits 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(BENCH_DIR))
+    from fake_spotify import start_server
+    from rich.console import Console
+
+    server = start_server(args.playlists, args.tracks, args.latency_ms, args.jitter_ms)
+    sc = load_controller(server)
+    commands = args.commands.split(",") if args.commands else list(SCRIPTS)
+
+    results = run_benchmark(sc, server, commands, args.iterations)
+    console = Console()
+    print_results(results, console)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for name, metric, base, current in regressions:
+            console.print(f"[red]Regression in {name}: {metric} {base} -> {current}[/red]")
+        if regressions:
+            sys.exit(1)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the parts of the Spotify Web API used by spotify_controller.py.
+
+Serves a synthetic, deterministic library (playlists of generated tracks)
+and a simulated player, with optional injected latency. Counters for
+requests and bytes per endpoint are kept for benchmarks and exposed at
+GET /__stats (POST /__reset clears them).
+
+Run standalone with e.g.:
+    python bench/fake_spotify.py --port 8765 --playlists 500 --tracks 10000 --latency-ms 80
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MARKETS = ["AD", "AR", "AT", "AU", "BE", "BR", "CA", "CH", "DE", "DK", "ES", "FI", "FR", "GB", "IE", "IT", "JP", "NL", "NO", "SE", "US"]
+WORDS = ["love", "night", "summer", "dream", "fire", "heart", "light", "river", "gold", "shadow",
+         "ocean", "city", "wild", "echo", "storm", "star", "blue", "road", "ghost", "rain"]
+
+
+class FakeLibrary:
+    """
+    Deterministic synthetic music library and player state.
+
+    Tracks are generated from their number on demand, so very large
+    libraries (e.g. 500 playlists of 10k tracks) cost no memory until a
+    playlist is edited.
+    """
+
+    def __init__(self, playlists: int = 50, tracks: int = 200):
+        self.tracks_per_playlist = tracks
+        self.catalog_size = max(1, playlists * tracks)
+        self._lock = threading.Lock()
+        self._playlists = [
+            {"id": f"pl{p}", "name": f"Playlist {p}", "version": 0, "tracks": None}
+            for p in range(playlists)
+        ]
+        self.player = {
+            "context_uri": "spotify:playlist:pl0" if playlists else None,
+            "tracks": list(range(min(tracks, 100))) or [0],
+            "index": 0,
+            "is_playing": True,
+            "started": time.monotonic(),
+            "shuffle": False,
+            "repeat": "off",
+            "volume": 50,
+            "queue": [],
+        }
+
+    # ------------------ Tracks ------------------ #
+    def track(self, n: int) -> dict:
+        words = [WORDS[(n * 7 + k) % len(WORDS)] for k in range(3)]
+        artist_no = n % 997
+        album_no = n // 12
+        return {
+            "id": f"t{n}",
+            "uri": f"spotify:track:t{n}",
+            "name": f"{words[0].title()} {words[1]} {words[2]} {n}",
+            "type": "track",
+            "duration_ms": 150000 + (n * 7919) % 120000,
+            "explicit": False,
+            "popularity": n % 100,
+            "track_number": n % 12 + 1,
+            "available_markets": MARKETS,
+            "artists": [{"id": f"ar{artist_no}", "name": f"Artist {artist_no}", "type": "artist",
+                         "uri": f"spotify:artist:ar{artist_no}"}],
+            "album": {
+                "id": f"al{album_no}", "name": f"Album {album_no}", "type": "album",
+                "uri": f"spotify:album:al{album_no}", "available_markets": MARKETS,
+                "images": [{"url": f"https://i.example/{album_no}/{size}", "height": size, "width": size}
+                           for size in (640, 300, 64)],
+            },
+        }
+
+    @staticmethod
+    def track_number(uri: str) -> int:
+        return int(uri.rsplit(":", 1)[-1].lstrip("t"))
+
+    # ------------------ Playlists ------------------ #
+    def _find(self, playlist_id: str):
+        for playlist in self._playlists:
+            if playlist["id"] == playlist_id:
+                return playlist
+        return None
+
+    def _track_numbers(self, playlist: dict):
+        if playlist["tracks"] is not None:
+            return playlist["tracks"]
+        p = int(playlist["id"][2:])
+        start = p * self.tracks_per_playlist
+        return range(start, start + self.tracks_per_playlist)
+
+    def _simple_playlist(self, playlist: dict) -> dict:
+        return {
+            "id": playlist["id"],
+            "name": playlist["name"],
+            "uri": f"spotify:playlist:{playlist['id']}",
+            "snapshot_id": f"{playlist['id']}-v{playlist['version']}",
+            "tracks": {"total": len(self._track_numbers(playlist))},
+            "owner": {"id": "bench-user"},
+            "public": False,
+        }
+
+    def playlists_page(self, offset: int, limit: int) -> dict:
+        with self._lock:
+            items = [self._simple_playlist(p) for p in self._playlists[offset:offset + limit]]
+            total = len(self._playlists)
+        return {"items": items, "offset": offset, "limit": limit, "total": total,
+                "next": None if offset + limit >= total else f"me/playlists?offset={offset + limit}&limit={limit}"}
+
+    def playlist(self, playlist_id: str):
+        with self._lock:
+            playlist = self._find(playlist_id)
+            return self._simple_playlist(playlist) if playlist else None
+
+    def playlist_items(self, playlist_id: str, offset: int, limit: int):
+        with self._lock:
+            playlist = self._find(playlist_id)
+            if playlist is None:
+                return None
+            numbers = self._track_numbers(playlist)
+            window = list(numbers[offset:offset + limit])
+            total = len(numbers)
+        return {"items": [{"added_at": "2024-01-01T00:00:00Z", "track": self.track(n)} for n in window],
+                "offset": offset, "limit": limit, "total": total}
+
+    def add_items(self, playlist_id: str, uris: list, position=None):
+        with self._lock:
+            playlist = self._find(playlist_id)
+            if playlist is None:
+                return None
+            numbers = list(self._track_numbers(playlist))
+            new = [self.track_number(uri) for uri in uris]
+            position = len(numbers) if position is None else position
+            numbers[position:position] = new
+            playlist["tracks"] = numbers
+            playlist["version"] += 1
+            return {"snapshot_id": f"{playlist['id']}-v{playlist['version']}"}
+
+    def remove_items(self, playlist_id: str, tracks: list):
+        with self._lock:
+            playlist = self._find(playlist_id)
+            if playlist is None:
+                return None
+            numbers = list(self._track_numbers(playlist))
+            drop_all = {self.track_number(t["uri"]) for t in tracks if "positions" not in t}
+            drop_positions = {pos for t in tracks for pos in t.get("positions", [])}
+            playlist["tracks"] = [n for i, n in enumerate(numbers) if n not in drop_all and i not in drop_positions]
+            playlist["version"] += 1
+            return {"snapshot_id": f"{playlist['id']}-v{playlist['version']}"}
+
+    def create_playlist(self, name: str, public: bool, description: str):
+        with self._lock:
+            playlist_id = f"pl{len(self._playlists)}"
+            playlist = {"id": playlist_id, "name": name, "version": 0, "tracks": []}
+            self._playlists.append(playlist)
+            return self._simple_playlist(playlist)
+
+    # ------------------ Search ------------------ #
+    def search(self, query: str, limit: int, offset: int) -> dict:
+        start = int(hashlib.md5(query.lower().encode()).hexdigest(), 16) % self.catalog_size
+        items = [self.track((start + offset + k) % self.catalog_size) for k in range(limit)]
+        return {"tracks": {"items": items, "offset": offset, "limit": limit, "total": self.catalog_size}}
+
+    # ------------------ Player ------------------ #
+    def playback(self):
+        with self._lock:
+            pl = self.player
+            if not pl["tracks"]:
+                return None
+            item = self.track(pl["tracks"][pl["index"] % len(pl["tracks"])])
+            elapsed = int((time.monotonic() - pl["started"]) * 1000) if pl["is_playing"] else pl.get("paused_at", 0)
+            return {
+                "device": {"id": "bench-device", "name": "Bench", "type": "Computer", "volume_percent": pl["volume"], "is_active": True},
+                "shuffle_state": pl["shuffle"],
+                "repeat_state": pl["repeat"],
+                "timestamp": int(time.time() * 1000),
+                "context": {"uri": pl["context_uri"], "type": "playlist"} if pl["context_uri"] else None,
+                "progress_ms": min(elapsed, item["duration_ms"]),
+                "item": item,
+                "currently_playing_type": "track",
+                "is_playing": pl["is_playing"],
+            }
+
+    def play(self, body: dict):
+        with self._lock:
+            pl = self.player
+            if body.get("context_uri"):
+                playlist = self._find(body["context_uri"].rsplit(":", 1)[-1])
+                numbers = list(self._track_numbers(playlist)) if playlist else []
+                pl.update(context_uri=body["context_uri"], tracks=numbers[:500] or [0], index=0)
+            elif body.get("uris"):
+                pl.update(context_uri=None, tracks=[self.track_number(u) for u in body["uris"]], index=0)
+            pl.update(is_playing=True, started=time.monotonic())
+
+    def pause(self):
+        with self._lock:
+            pl = self.player
+            pl["paused_at"] = int((time.monotonic() - pl["started"]) * 1000)
+            pl["is_playing"] = False
+
+    def skip(self, step: int):
+        with self._lock:
+            pl = self.player
+            if step > 0 and pl["queue"]:
+                pl["tracks"].insert(pl["index"] + 1, pl["queue"].pop(0))
+            pl["index"] = max(0, pl["index"] + step) % max(1, len(pl["tracks"]))
+            pl.update(is_playing=True, started=time.monotonic())
+
+    def queue(self):
+        with self._lock:
+            pl = self.player
+            upcoming = pl["queue"] + [pl["tracks"][(pl["index"] + k) % len(pl["tracks"])] for k in range(1, 20)]
+            current = pl["tracks"][pl["index"] % len(pl["tracks"])]
+        return {"currently_playing": self.track(current), "queue": [self.track(n) for n in upcoming[:20]]}
+
+    def add_to_queue(self, uri: str):
+        with self._lock:
+            self.player["queue"].append(self.track_number(uri))
+
+
+class FakeSpotifyServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to a FakeLibrary, with request/byte counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address, library: FakeLibrary, latency_ms: float = 0, jitter_ms: float = 0):
+        super().__init__(address, _Handler)
+        self.library = library
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/v1/"
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self.stats = {"requests": 0, "bytes_in": 0, "bytes_out": 0, "endpoints": {}}
+
+    def record(self, endpoint: str, bytes_in: int, bytes_out: int):
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_in"] += bytes_in
+            self.stats["bytes_out"] += bytes_out
+            ep = self.stats["endpoints"].setdefault(endpoint, {"requests": 0, "bytes_out": 0})
+            ep["requests"] += 1
+            ep["bytes_out"] += bytes_out
+
+    def snapshot(self) -> dict:
+        with self._stats_lock:
+            return json.loads(json.dumps(self.stats))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    ROUTES = [
+        ("GET", r"me/?", "me"),
+        ("GET", r"me/player", "player"),
+        ("GET", r"me/player/queue", "queue"),
+        ("POST", r"me/player/queue", "add_to_queue"),
+        ("PUT", r"me/player/play", "play"),
+        ("PUT", r"me/player/pause", "pause"),
+        ("POST", r"me/player/next", "next"),
+        ("POST", r"me/player/previous", "previous"),
+        ("PUT", r"me/player/volume", "volume"),
+        ("PUT", r"me/player/shuffle", "shuffle"),
+        ("PUT", r"me/player/repeat", "repeat"),
+        ("GET", r"me/playlists", "playlists"),
+        ("GET", r"playlists/(?P<pid>[^/]+)", "playlist"),
+        ("GET", r"playlists/(?P<pid>[^/]+)/tracks", "playlist_items"),
+        ("POST", r"playlists/(?P<pid>[^/]+)/tracks", "add_items"),
+        ("DELETE", r"playlists/(?P<pid>[^/]+)/tracks", "remove_items"),
+        ("POST", r"users/(?P<uid>[^/]+)/playlists", "create_playlist"),
+        ("GET", r"search", "search"),
+    ]
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _send(self, status: int, body=None, endpoint: str = None, bytes_in: int = 0):
+        data = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+        if endpoint:
+            self.server.record(endpoint, bytes_in, len(data))
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+
+        if url.path == "/__stats":
+            return self._send(200, self.server.snapshot())
+        if url.path == "/__reset":
+            self.server.reset_stats()
+            return self._send(204)
+
+        path = url.path[len("/v1/"):] if url.path.startswith("/v1/") else url.path.lstrip("/")
+        for route_method, pattern, name in self.ROUTES:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                break
+        else:
+            return self._send(404, {"error": {"status": 404, "message": f"No fake endpoint for {method} {path}"}},
+                              f"{method} unknown", len(raw))
+
+        server = self.server
+        if server.latency_ms or server.jitter_ms:
+            time.sleep((server.latency_ms + random.uniform(0, server.jitter_ms)) / 1000)
+
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            body = {}
+        status, result = self._handle(name, match.groupdict(), query, body)
+        self._send(status, result, f"{method} {pattern}", len(raw))
+
+    def _handle(self, name: str, args: dict, query: dict, body: dict):
+        lib = self.server.library
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 20))
+
+        if name == "me":
+            return 200, {"id": "bench-user", "display_name": "Bench User", "type": "user"}
+        if name == "player":
+            playback = lib.playback()
+            return (200, playback) if playback else (204, None)
+        if name == "queue":
+            return 200, lib.queue()
+        if name == "add_to_queue":
+            lib.add_to_queue(query["uri"])
+            return 204, None
+        if name == "play":
+            lib.play(body)
+            return 204, None
+        if name == "pause":
+            lib.pause()
+            return 204, None
+        if name in ("next", "previous"):
+            lib.skip(1 if name == "next" else -1)
+            return 204, None
+        if name == "volume":
+            lib.player["volume"] = int(query["volume_percent"])
+            return 204, None
+        if name == "shuffle":
+            lib.player["shuffle"] = query.get("state") == "true"
+            return 204, None
+        if name == "repeat":
+            lib.player["repeat"] = query.get("state", "off")
+            return 204, None
+        if name == "playlists":
+            return 200, lib.playlists_page(offset, min(limit, 50))
+        if name == "search":
+            return 200, lib.search(query.get("q", ""), min(limit, 50), offset)
+        if name == "create_playlist":
+            return 201, lib.create_playlist(body.get("name", ""), body.get("public", True), body.get("description", ""))
+
+        result = None
+        if name == "playlist":
+            result = lib.playlist(args["pid"])
+        elif name == "playlist_items":
+            result = lib.playlist_items(args["pid"], offset, min(limit, 100))
+        elif name == "add_items":
+            # spotipy sends a bare list of URIs with the position as a query parameter.
+            uris = body if isinstance(body, list) else body.get("uris", [])
+            position = query.get("position", None if isinstance(body, list) else body.get("position"))
+            result = lib.add_items(args["pid"], uris, None if position is None else int(position))
+        elif name == "remove_items":
+            result = lib.remove_items(args["pid"], body.get("tracks", []))
+        if result is None:
+            return 404, {"error": {"status": 404, "message": "Not found"}}
+        return (201 if name == "add_items" else 200), result
+
+
+def start_server(playlists: int = 50, tracks: int = 200, latency_ms: float = 0, jitter_ms: float = 0,
+                 host: str = "127.0.0.1", port: int = 0) -> FakeSpotifyServer:
+    """
+    Start a fake Spotify server on a background thread.
+
+    Returns:
+        FakeSpotifyServer: The running server; see base_url, snapshot() and shutdown().
+    """
+    server = FakeSpotifyServer((host, port), FakeLibrary(playlists, tracks), latency_ms, jitter_ms)
+    threading.Thread(target=server.serve_forever, name="fake-spotify", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline fake Spotify Web API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--playlists", type=int, default=50)
+    parser.add_argument("--tracks", type=int, default=200, help="tracks per playlist")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    server = FakeSpotifyServer((args.host, args.port), FakeLibrary(args.playlists, args.tracks),
+                               args.latency_ms, args.jitter_ms)
+    print(f"Fake Spotify API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -124,6 +124,11 @@ pip install -r "$PROJECT_DIR/requirements.txt"
 echo "Creating shortcut command 'spotuify'..."
 cat << EOF | sudo tee /usr/local/bin/spotuify > /dev/null
 #!/bin/bash
+# One-shot commands (spotuify next, spotuify show --json) go through the thin client,
+# which forwards them to the daemon and falls back to the full controller without one.
+if [ \$# -gt 0 ] && [ "\${1#-}" = "\$1" ]; then
+    exec "\$HOME/spotify_env/bin/python3" -S "\$HOME/spotify_controller/spotuify.py" "\$@"
+fi
 source "\$HOME/spotify_env/bin/activate"
 python3 "\$HOME/spotify_controller/spotify_controller.py" "\$@"
 EOF
@@ -1,23 +1,55 @@
 from rich.console import Console
 from rich.panel import Panel
+from rich.segment import Segments
 from rich.text import Text
 import os
 
 console = Console()
 
-def show_title(file_path: str, index: int = 0, color: str = "bold cyan", border_color: str = "green", indent: int = 0):
-    """Load and display an ASCII art title from file."""
-    if not os.path.exists(file_path):
-        console.print(f"[red]Title file not found: {file_path}[/red]")
-        return
+# (file path, mtime) -> list of raw title blocks
+_title_blocks = {}
+# (file path, mtime, index, indent, color, border color, width) -> rendered segments
+_rendered_titles = {}
+
+def load_titles(file_path: str, mtime: int):
+    """Parse the title blocks of a logo file, reusing the result until its mtime changes."""
+    key = (str(file_path), mtime)
+    if key not in _title_blocks:
+        with open(file_path, "r", encoding="utf-8") as f:
+            blocks = [block.strip("\n ") for block in f.read().split(":") if block.strip()]
+        _title_blocks.clear()
+        _rendered_titles.clear()
+        _title_blocks[key] = blocks
+    return _title_blocks[key]
+
+def render_title(file_path: str, index: int = 0, color: str = "bold cyan", border_color: str = "green", indent: int = 0, width: int = None):
+    """
+    Return an ASCII art title as a renderable, reusing cached segments when possible.
+
+    Returns:
+        Segments or Text: The rendered title panel, or an error message.
+    """
+    try:
+        mtime = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return Text.from_markup(f"[red]Title file not found: {file_path}[/red]")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        titles = [(" " * indent) + block.strip("\n ") for block in f.read().split(":") if block.strip()]
+    titles = load_titles(file_path, mtime)
 
     if index < 0 or index >= len(titles):
-        console.print(f"[red]Invalid title index {index}[/red]")
-        return
+        return Text.from_markup(f"[red]Invalid title index {index}[/red]")
 
-    text = Text(titles[index], style=color)
-    panel = Panel(text, border_style=border_color, expand=False)
-    console.print(panel)
+    width = width or console.size.width
+    key = (str(file_path), mtime, index, indent, color, border_color, width)
+    segments = _rendered_titles.get(key)
+    if segments is None:
+        text = Text((" " * indent) + titles[index], style=color)
+        panel = Panel(text, border_style=border_color, expand=False)
+        segments = list(console.render(panel, console.options.update_width(width)))
+        _rendered_titles[key] = segments
+
+    return Segments(segments)
+
+def show_title(file_path: str, index: int = 0, color: str = "bold cyan", border_color: str = "green", indent: int = 0):
+    """Load and display an ASCII art title from file."""
+    console.print(render_title(file_path, index=index, color=color, border_color=border_color, indent=indent))
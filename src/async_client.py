@@ -0,0 +1,206 @@
+import asyncio
+import threading
+
+import httpx
+from spotipy.exceptions import SpotifyException
+
+from transport import IDEMPOTENT_METHODS, RETRY_STATUSES, notify, retry_delay
+
+API_BASE = "https://api.spotify.com/v1/"
+
+
+class AsyncSpotify:
+    """
+    Minimal asyncio Spotify Web API client covering the endpoints the controller uses.
+
+    Method names and return values mirror spotipy.Spotify, so results can be
+    used interchangeably. Errors are raised as SpotifyException.
+    """
+
+    def __init__(self, token_provider, base_url: str = API_BASE, timeout: float = 10.0, max_connections: int = 10,
+                 max_retries: int = 3, backoff_factor: float = 0.3):
+        """
+        Parameters:
+            token_provider (callable): Returns a valid access token string; called on a
+                worker thread, since it may block.
+            base_url (str): Web API base URL.
+            timeout (float): Request timeout in seconds.
+            max_connections (int): Size of the keep-alive connection pool.
+            max_retries (int): Retries for connection errors, 429 and transient 5xx
+                (POST only on connection errors and 429).
+            backoff_factor (float): Base for the jittered exponential backoff.
+        """
+        self._token_provider = token_provider
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def _request(self, method: str, path: str, params: dict = None, payload: dict = None):
+        # The provider may refresh the token over the network; keep that off the event loop.
+        token = await asyncio.get_running_loop().run_in_executor(None, self._token_provider)
+        headers = {"Authorization": f"Bearer {token}"}
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._client.request(method, path, params=params, json=payload, headers=headers)
+            except httpx.TransportError as e:
+                # Past the connect phase a POST may already have been applied.
+                not_sent = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                if attempt > self.max_retries or not (idempotent or not_sent):
+                    raise
+                notify("retry", url=path, status=None)
+                await asyncio.sleep(retry_delay(attempt, self.backoff_factor))
+                continue
+            retryable = idempotent or response.status_code == 429
+            if retryable and response.status_code in RETRY_STATUSES and attempt <= self.max_retries:
+                notify("retry", url=path, status=response.status_code)
+                await asyncio.sleep(retry_delay(attempt, self.backoff_factor, response.headers.get("Retry-After")))
+                continue
+            break
+
+        notify("response", status=response.status_code, seconds=response.elapsed.total_seconds(), url=str(response.url))
+        if response.status_code >= 400:
+            try:
+                msg = response.json().get("error", {}).get("message", response.text)
+            except ValueError:
+                msg = response.text
+            raise SpotifyException(
+                response.status_code, -1, f"{response.request.url}:\n {msg}",
+                reason=msg, headers=dict(response.headers),
+            )
+        if response.status_code == 204 or not response.content:
+            return None
+        return response.json()
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    # ------------------ Playback ------------------ #
+    async def current_playback(self):
+        return await self._request("GET", "me/player")
+
+    async def start_playback(self, device_id=None, context_uri=None, uris=None, offset=None, position_ms=None):
+        payload = {}
+        if context_uri:
+            payload["context_uri"] = context_uri
+        if uris:
+            payload["uris"] = uris
+        if offset is not None:
+            payload["offset"] = offset
+        if position_ms is not None:
+            payload["position_ms"] = position_ms
+        return await self._request("PUT", "me/player/play", {"device_id": device_id}, payload or None)
+
+    async def pause_playback(self, device_id=None):
+        return await self._request("PUT", "me/player/pause", {"device_id": device_id})
+
+    async def next_track(self, device_id=None):
+        return await self._request("POST", "me/player/next", {"device_id": device_id})
+
+    async def previous_track(self, device_id=None):
+        return await self._request("POST", "me/player/previous", {"device_id": device_id})
+
+    async def volume(self, volume_percent: int, device_id=None):
+        return await self._request("PUT", "me/player/volume", {"volume_percent": volume_percent, "device_id": device_id})
+
+    async def shuffle(self, state: bool, device_id=None):
+        return await self._request("PUT", "me/player/shuffle", {"state": str(state).lower(), "device_id": device_id})
+
+    async def repeat(self, state: str, device_id=None):
+        return await self._request("PUT", "me/player/repeat", {"state": state, "device_id": device_id})
+
+    # ------------------ Queue ------------------ #
+    async def queue(self):
+        return await self._request("GET", "me/player/queue")
+
+    async def add_to_queue(self, uri: str, device_id=None):
+        return await self._request("POST", "me/player/queue", {"uri": uri, "device_id": device_id})
+
+    # ------------------ Search ------------------ #
+    async def search(self, q: str, limit: int = 10, offset: int = 0, type: str = "track", market=None):
+        return await self._request("GET", "search", {"q": q, "limit": limit, "offset": offset, "type": type, "market": market})
+
+    # ------------------ Playlists ------------------ #
+    async def me(self):
+        return await self._request("GET", "me")
+
+    async def current_user_playlists(self, limit: int = 50, offset: int = 0):
+        return await self._request("GET", "me/playlists", {"limit": limit, "offset": offset})
+
+    async def playlist(self, playlist_id: str, fields=None, market=None):
+        return await self._request("GET", f"playlists/{playlist_id}", {"fields": fields, "market": market})
+
+    async def playlist_items(self, playlist_id: str, fields=None, limit: int = 100, offset: int = 0, market=None):
+        return await self._request(
+            "GET", f"playlists/{playlist_id}/tracks",
+            {"fields": fields, "limit": limit, "offset": offset, "market": market},
+        )
+
+    async def playlist_add_items(self, playlist_id: str, items: list, position=None):
+        payload = {"uris": items}
+        if position is not None:
+            payload["position"] = position
+        return await self._request("POST", f"playlists/{playlist_id}/tracks", payload=payload)
+
+    async def playlist_remove_all_occurrences_of_items(self, playlist_id: str, items: list, snapshot_id=None):
+        payload = {"tracks": [{"uri": uri} for uri in items]}
+        if snapshot_id:
+            payload["snapshot_id"] = snapshot_id
+        return await self._request("DELETE", f"playlists/{playlist_id}/tracks", payload=payload)
+
+    async def playlist_remove_specific_occurrences_of_items(self, playlist_id: str, items: list, snapshot_id=None):
+        payload = {"tracks": [{"uri": item["uri"], "positions": item["positions"]} for item in items]}
+        if snapshot_id:
+            payload["snapshot_id"] = snapshot_id
+        return await self._request("DELETE", f"playlists/{playlist_id}/tracks", payload=payload)
+
+    async def user_playlist_create(self, user: str, name: str, public: bool = True, collaborative: bool = False, description: str = ""):
+        payload = {"name": name, "public": public, "collaborative": collaborative, "description": description}
+        return await self._request("POST", f"users/{user}/playlists", payload=payload)
+
+
+class SyncSpotify:
+    """
+    Blocking adapter around AsyncSpotify for the existing command functions.
+
+    The async client runs on an event loop in a background thread. Attribute
+    access returns blocking wrappers with spotipy's method names, so calls
+    from several threads share one loop and connection pool.
+    """
+
+    # The adapter's own methods, as opposed to Web API calls on the client.
+    LOCAL_METHODS = frozenset(["run", "close"])
+
+    def __init__(self, client: AsyncSpotify):
+        self.client = client
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="spotify-async-loop", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        if not asyncio.iscoroutinefunction(method):
+            return method
+
+        def call(*args, **kwargs):
+            return self.run(method(*args, **kwargs))
+
+        return call
+
+    def run(self, coro):
+        """Run a coroutine on the client loop and block until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self):
+        """Close the client and stop the event loop."""
+        self.run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
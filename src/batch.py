@@ -0,0 +1,140 @@
+import shlex
+
+# Spotify accepts at most 100 items per playlist add/remove request.
+MAX_ITEMS_PER_REQUEST = 100
+REPEAT_STATES = ("off", "context", "track")
+
+# Command name -> (minimum args, maximum args or None, usage)
+BATCH_COMMANDS = {
+    "next": (0, 0, "next"),
+    "prev": (0, 0, "prev"),
+    "pause": (0, 0, "pause"),
+    "resume": (0, 0, "resume"),
+    "volume": (1, 1, "volume <0-100>"),
+    "shuffle": (1, 1, "shuffle <on|off>"),
+    "repeat": (1, 1, "repeat <off|context|track>"),
+    "play": (1, None, "play <track uri...> | play <playlist/album uri>"),
+    "queue": (1, None, "queue <track uri...>"),
+    "add-to-list": (2, None, "add-to-list <playlist> <track uri...>"),
+    "remove-from-list": (2, None, "remove-from-list <playlist> <track uri...>"),
+}
+
+
+class BatchError(ValueError):
+    """A batch line that cannot be parsed or run."""
+
+
+class BatchOp:
+    """One batch command with its arguments and the line(s) it came from."""
+
+    __slots__ = ("name", "args", "lines")
+
+    def __init__(self, name: str, args: list, lines: list):
+        self.name = name
+        self.args = args
+        self.lines = lines
+
+    def __repr__(self):
+        return f"BatchOp({self.name!r}, {self.args!r}, lines={self.lines!r})"
+
+
+def parse_line(line: str, lineno: int = 1):
+    """
+    Parse one batch line into a BatchOp.
+
+    Lines are split like a shell command, so playlist names containing spaces
+    can be quoted. Blank lines and lines starting with # are ignored.
+
+    Returns:
+        BatchOp or None: The parsed command, or None for a blank/comment line.
+
+    Raises:
+        BatchError: On an unknown command or wrong number of arguments.
+    """
+    try:
+        words = shlex.split(line, comments=True)
+    except ValueError as e:
+        raise BatchError(f"line {lineno}: {e}")
+    if not words:
+        return None
+
+    name, args = words[0].lower().replace("_", "-"), words[1:]
+    if name not in BATCH_COMMANDS:
+        raise BatchError(f"line {lineno}: unknown command {words[0]!r}")
+    low, high, usage = BATCH_COMMANDS[name]
+    if len(args) < low or (high is not None and len(args) > high):
+        raise BatchError(f"line {lineno}: usage: {usage}")
+
+    if name == "volume":
+        try:
+            args = [max(0, min(100, int(args[0])))]
+        except ValueError:
+            raise BatchError(f"line {lineno}: volume must be a number from 0 to 100")
+    elif name == "shuffle":
+        if args[0].lower() not in ("on", "off", "true", "false"):
+            raise BatchError(f"line {lineno}: usage: {usage}")
+        args = [args[0].lower() in ("on", "true")]
+    elif name == "repeat":
+        if args[0].lower() not in REPEAT_STATES:
+            raise BatchError(f"line {lineno}: usage: {usage}")
+        args = [args[0].lower()]
+    return BatchOp(name, args, [lineno])
+
+
+def parse_script(lines):
+    """
+    Parse every line of a batch script.
+
+    Returns:
+        tuple: (list of BatchOp, list of BatchError) -- valid lines are kept
+        even when others fail, so the caller decides whether to run them.
+    """
+    ops, errors = [], []
+    for lineno, line in enumerate(lines, 1):
+        try:
+            op = parse_line(line, lineno)
+        except BatchError as e:
+            errors.append(e)
+            continue
+        if op is not None:
+            ops.append(op)
+    return ops, errors
+
+
+def coalesce(ops, playlist_key=None):
+    """
+    Merge adjacent operations that the API can serve with one request.
+
+    Consecutive add-to-list (or remove-from-list) lines for the same playlist
+    become one operation carrying all of their tracks; it is split into
+    requests of MAX_ITEMS_PER_REQUEST when run. Only adjacent lines are
+    merged, so the order of effects is the same as in the script.
+
+    Parameters:
+        ops (list): Parsed operations.
+        playlist_key (callable, optional): Maps a playlist reference to a key, so
+            that e.g. a name and a URI of the same playlist are merged.
+
+    Returns:
+        list: The merged operations.
+    """
+    key = playlist_key or (lambda ref: ref)
+    merged = []
+    for op in ops:
+        prev = merged[-1] if merged else None
+        if (
+            prev is not None
+            and op.name in ("add-to-list", "remove-from-list")
+            and prev.name == op.name
+            and key(prev.args[0]) == key(op.args[0])
+        ):
+            prev.args.extend(op.args[1:])
+            prev.lines.extend(op.lines)
+        else:
+            merged.append(BatchOp(op.name, list(op.args), list(op.lines)))
+    return merged
+
+
+def chunks(items: list, size: int = MAX_ITEMS_PER_REQUEST):
+    """Split a list into consecutive slices of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
@@ -0,0 +1,144 @@
+import threading
+
+SKIPS = ("next", "prev")
+
+
+class PendingOp:
+    """
+    A merged mutation waiting to be sent.
+
+    For next/prev, value is the number of skips. For a setting it is the
+    value to send, and original is the value before the first change in
+    this window.
+    """
+
+    __slots__ = ("kind", "value", "original")
+
+    def __init__(self, kind: str, value, original=None):
+        self.kind = kind
+        self.value = value
+        self.original = original
+
+    def __repr__(self):
+        return f"PendingOp({self.kind!r}, {self.value!r})"
+
+
+class CommandQueue:
+    """
+    Debounced queue that merges rapid playback mutations before they are sent.
+
+    Mutations submitted within `window` seconds of each other are merged:
+    consecutive skips in the same direction become one burst, only the last
+    value of a setting is kept, and a setting changed back to the value it
+    had before the window (e.g. shuffle toggled twice) is dropped. The merged
+    operations are sent in order when the window closes or on flush(). A
+    window of 0 sends every submission right away.
+    """
+
+    def __init__(self, send, window: float = 0.4, on_flushed=None):
+        """
+        Parameters:
+            send (callable): Called as send(op) for each merged PendingOp; makes the API calls.
+            window (float): Seconds without a new submission before the queue is sent.
+            on_flushed (callable, optional): Called after every flush that sent something.
+        """
+        self._send = send
+        self.window = window
+        self._on_flushed = on_flushed
+        self._ops = []
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._timer = None
+        self.errors = []
+        self.submitted = 0
+        self.sent = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ops)
+
+    def submit(self, kind: str, value=None, original=None):
+        """
+        Queue a mutation, merging it with the pending ones.
+
+        Parameters:
+            kind (str): "next", "prev", "volume", "shuffle" or "repeat".
+            value: New value of a setting; ignored for skips.
+            original: Current value of the setting, used to detect changes that cancel out.
+
+        Returns:
+            list: Errors from sending, only when the window is 0 (sent right away).
+        """
+        with self._lock:
+            self.submitted += 1
+            if kind in SKIPS:
+                # Settings commute with skips, so a burst continues past them.
+                last_skip = next((op for op in reversed(self._ops) if op.kind in SKIPS), None)
+                if last_skip is not None and last_skip.kind == kind:
+                    last_skip.value += 1
+                else:
+                    self._ops.append(PendingOp(kind, 1))
+            else:
+                pending = next((op for op in self._ops if op.kind == kind), None)
+                if pending is None:
+                    if value != original:
+                        self._ops.append(PendingOp(kind, value, original))
+                elif value == pending.original:
+                    self._ops.remove(pending)
+                else:
+                    pending.value = value
+            if self.window > 0:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(self.window, self._flush_in_background)
+                self._timer.name = "command-queue"
+                self._timer.daemon = True
+                self._timer.start()
+        if self.window <= 0:
+            return self.flush()
+        return []
+
+    def pending(self, kind: str):
+        """Return the pending skip count, or the pending value of a setting (None if unchanged)."""
+        with self._lock:
+            if kind in SKIPS:
+                return sum(op.value for op in self._ops if op.kind == kind)
+            return next((op.value for op in self._ops if op.kind == kind), None)
+
+    def flush(self):
+        """
+        Send the pending operations now, in the order they were first queued.
+
+        Returns:
+            list: (PendingOp, exception) for every operation that failed.
+        """
+        with self._lock:
+            ops, self._ops = self._ops, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not ops:
+            return []
+        errors = []
+        with self._send_lock:
+            for op in ops:
+                try:
+                    self._send(op)
+                    self.sent += 1
+                except Exception as e:
+                    errors.append((op, e))
+        if self._on_flushed:
+            self._on_flushed()
+        return errors
+
+    def take_errors(self):
+        """Return and clear the errors from flushes that ran in the background."""
+        with self._lock:
+            errors, self.errors = self.errors, []
+        return errors
+
+    def _flush_in_background(self):
+        errors = self.flush()
+        if errors:
+            with self._lock:
+                self.errors.extend(errors)
@@ -0,0 +1,123 @@
+import json
+import os
+import socket
+import socketserver
+
+# Requests and responses are one JSON object per line.
+MAX_MESSAGE_BYTES = 1 << 20
+# Windows has no Unix domain sockets in the standard library, so no daemon there.
+UNIX_SOCKETS = hasattr(socket, "AF_UNIX") and hasattr(socketserver, "UnixStreamServer")
+
+
+def socket_path() -> str:
+    """
+    Return the path of the daemon's Unix socket.
+
+    SPOTUIFY_SOCKET overrides it; otherwise the socket lives in
+    $XDG_RUNTIME_DIR when set, or next to the other controller files.
+    """
+    if os.getenv("SPOTUIFY_SOCKET"):
+        return os.environ["SPOTUIFY_SOCKET"]
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "spotuify.sock")
+    return os.path.join(os.path.expanduser("~/spotify_controller"), "daemon.sock")
+
+
+def send_request(request: dict, path: str = None, timeout: float = 30.0) -> dict:
+    """
+    Send one request to the daemon and wait for its response.
+
+    Parameters:
+        request (dict): {"args": [command words], ...} as handled by the daemon.
+        path (str, optional): Socket path, defaults to socket_path().
+        timeout (float): Seconds to wait for the response.
+
+    Returns:
+        dict: The daemon's response, e.g. {"status": 0, "output": "..."}.
+
+    Raises:
+        OSError: If no daemon is listening on the socket, or the platform has no Unix sockets.
+    """
+    if not UNIX_SOCKETS:
+        raise OSError("Unix domain sockets are not supported on this platform")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(path or socket_path())
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with conn.makefile("rb") as reader:
+            line = reader.readline(MAX_MESSAGE_BYTES)
+    if not line:
+        raise ConnectionError("daemon closed the connection without answering")
+    return json.loads(line)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline(MAX_MESSAGE_BYTES)
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict) or not isinstance(request.get("args"), list):
+                raise ValueError("request must be an object with an 'args' list")
+            response = self.server.handle_request_dict(request)
+        except Exception as e:
+            response = {"status": 2, "output": f"{type(e).__name__}: {e}\n"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingMixIn, getattr(socketserver, "UnixStreamServer", socketserver.TCPServer)):
+    """
+    Unix socket server that hands each request to a handler in the daemon process.
+
+    Connections are served on their own threads so a slow command does not
+    block the socket; the handler is responsible for serializing commands
+    that share state. The socket is created with owner-only permissions,
+    since anyone who can connect can control the account's playback.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handler, path: str = None):
+        """
+        Parameters:
+            handler (callable): Called as handler(request) with the decoded request,
+                returns the response dict.
+            path (str, optional): Socket path, defaults to socket_path().
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the path, or the
+                platform has no Unix sockets.
+        """
+        if not UNIX_SOCKETS:
+            raise RuntimeError("the daemon needs Unix domain sockets, which this platform doesn't support")
+        self.path = path or socket_path()
+        self.handle_request_dict = handler
+        _clear_stale_socket(self.path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(self.path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def _clear_stale_socket(path: str):
+    """Remove a socket file left by a daemon that is no longer running."""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+    raise RuntimeError(f"a daemon is already listening on {path}")
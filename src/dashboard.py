@@ -0,0 +1,262 @@
+import io
+import shutil
+import threading
+import time
+from collections import deque
+
+from rich.console import Console
+
+from metrics import TimedConsole
+
+CSI = "\x1b["
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+
+
+class _OutputBuffer(io.TextIOBase):
+    """File object that collects the dashboard console's output as lines."""
+
+    def __init__(self, dashboard, max_lines: int = 1000):
+        self._dashboard = dashboard
+        self.lines = deque(maxlen=max_lines)
+        self.partial = ""
+        # Lines ever completed, so positions stay valid when the deque drops old ones.
+        self.written = 0
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        *complete, self.partial = (self.partial + text).split("\n")
+        self.lines.extend(complete)
+        self.written += len(complete)
+        self._dashboard.mark_dirty("output")
+        return len(text)
+
+    def clear(self):
+        self.lines.clear()
+        self.partial = ""
+        self._dashboard.mark_dirty("output")
+
+
+class DashboardConsole(TimedConsole):
+    """
+    Console whose output goes to the dashboard's output region and whose
+    prompts are shown in the prompt region. Its height is the output
+    region's, so output sized from console.size fits the region.
+    """
+
+    # console.size is the space output has, not a terminal that also keeps earlier output in view.
+    is_region = True
+
+    def __init__(self, dashboard, **kwargs):
+        self._dashboard = dashboard
+        super().__init__(file=dashboard.output, force_terminal=True, **kwargs)
+
+    def input(self, prompt="", *, markup: bool = True, emoji: bool = True, password: bool = False, stream=None):
+        return self._dashboard.prompt(prompt, markup=markup, emoji=emoji, password=password)
+
+    def clear(self, home: bool = True):
+        self._dashboard.output.clear()
+
+
+class Dashboard:
+    """
+    Fixed-region terminal dashboard: header, now-playing, output and prompt.
+
+    Each region is rendered to lines and only lines that differ from what is
+    already on screen are rewritten, using absolute cursor positioning on the
+    alternate screen. Repaints are throttled to refresh_per_second, and the
+    now-playing region is re-rendered from its callback on the same schedule.
+    The output region shows the newest lines; when more output arrived since
+    the last prompt than the region holds, the next prompt first pages
+    through it from the top, one region at a time.
+    """
+
+    def __init__(self, base_console: Console, header, now_playing, refresh_per_second: float = 4.0):
+        """
+        Parameters:
+            base_console (Console): Console attached to the real terminal.
+            header (callable): Returns the header renderable for (width, height), or None.
+            now_playing (callable): Returns the now-playing renderable.
+            refresh_per_second (float): Maximum repaint rate.
+        """
+        self._term = base_console
+        self._stream = base_console.file
+        self._header = header
+        self._now_playing = now_playing
+        self._interval = 1.0 / refresh_per_second
+        self._lock = threading.RLock()
+        self._dirty = set()
+        self._screen = {}
+        self._regions = {}
+        self._size = None
+        self._prompt_text = ""
+        self._prompt_active = False
+        self._seen = 0
+        self._scroll = None
+        self._last_paint = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self.bytes_written = 0
+        self.output = _OutputBuffer(self)
+        self.console = DashboardConsole(self, color_system=base_console.color_system)
+
+    # ------------------ Lifecycle ------------------ #
+    def __enter__(self):
+        self._write(f"{CSI}?1049h{CSI}2J")
+        self._layout()
+        self.refresh(force=True)
+        self._thread = threading.Thread(target=self._run, name="dashboard-refresh", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        with self._lock:
+            self._write(f"{CSI}?1049l")
+            self._stream.flush()
+        return False
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self.mark_dirty("now_playing")
+            self.refresh()
+
+    # ------------------ Layout & rendering ------------------ #
+    def _layout(self):
+        width, height = shutil.get_terminal_size()
+        self._size = (width, height)
+        self.console.width = width
+        header_lines = self._render(self._header(width, height), width)
+        now_lines = self._render(self._now_playing(), width)
+        # Keep the last row free so the newline echoed after input never scrolls the screen.
+        if len(header_lines) + len(now_lines) + 5 > height:
+            header_lines = []
+        top = len(header_lines)
+        self._regions = {
+            "header": (0, len(header_lines)),
+            "now_playing": (top, len(now_lines)),
+            "output": (top + len(now_lines), max(1, height - 2 - top - len(now_lines))),
+            "prompt": (height - 2, 1),
+        }
+        self.console.height = self._regions["output"][1]
+        self._cached_header = header_lines
+        self._screen = {}
+        self._write(f"{CSI}2J")
+        self._dirty = set(self._regions)
+
+    def _render(self, renderable, width: int):
+        if renderable is None:
+            return []
+        scratch = Console(file=io.StringIO(), force_terminal=True, color_system=self._term.color_system, width=width)
+        scratch.print(renderable)
+        return scratch.file.getvalue().rstrip("\n").split("\n")
+
+    def _region_lines(self, name: str):
+        _, height = self._regions[name]
+        if name == "header":
+            return self._cached_header
+        if name == "now_playing":
+            return self._render(self._now_playing(), self._size[0])[:height]
+        if name == "output":
+            lines = list(self.output.lines)
+            if self._scroll is not None:
+                return lines[self._scroll:self._scroll + height]
+            return lines[-height:]
+        return [self._prompt_text]
+
+    def mark_dirty(self, region: str):
+        """Mark a region as needing a repaint on the next refresh."""
+        with self._lock:
+            self._dirty.add(region)
+
+    def refresh(self, force: bool = False):
+        """
+        Repaint dirty regions, at most refresh_per_second times per second unless forced.
+        """
+        with self._lock:
+            if not force and time.monotonic() - self._last_paint < self._interval:
+                return
+            if shutil.get_terminal_size() != self._size:
+                self._layout()
+            dirty, self._dirty = self._dirty, set()
+            out = []
+            for name in ("header", "now_playing", "output", "prompt"):
+                if name in dirty:
+                    out.append(self._paint(name, self._region_lines(name)))
+            self._last_paint = time.monotonic()
+            data = "".join(out)
+            if data:
+                self._write(SAVE_CURSOR + data + RESTORE_CURSOR if self._prompt_active else data)
+
+    def _paint(self, name: str, lines):
+        top, height = self._regions[name]
+        out = []
+        for i in range(height):
+            line = lines[i] if i < len(lines) else ""
+            row = top + i
+            if self._screen.get(row) != line:
+                self._screen[row] = line
+                out.append(f"{CSI}{row + 1};1H{CSI}0m{line}{CSI}0m{CSI}K")
+        return "".join(out)
+
+    def _write(self, data: str):
+        self._stream.write(data)
+        self._stream.flush()
+        self.bytes_written += len(data.encode("utf-8", "replace"))
+
+    # ------------------ Input ------------------ #
+    def prompt(self, prompt="", markup: bool = True, emoji: bool = True, password: bool = False) -> str:
+        """
+        Show a prompt in the prompt region and read a line of input there.
+
+        Output that overflowed the region since the previous prompt is paged
+        through first, so its top is not lost.
+        """
+        self._page_unseen_output()
+        self._seen = self.output.written
+        return self._read(prompt, markup=markup, emoji=emoji, password=password)
+
+    def _page_unseen_output(self):
+        _, height = self._regions["output"]
+        lines = self.output.lines
+        start = max(0, len(lines) - (self.output.written - self._seen))
+        try:
+            with self._lock:
+                self._scroll = start
+            while len(lines) - self._scroll > height:
+                first, total = self._scroll - start + 1, len(lines) - start
+                self.mark_dirty("output")
+                answer = self._read(f"[dim]Lines {first}-{first + height - 1} of {total} · Enter: more · q: skip to the end[/dim] ")
+                if answer.strip().lower() == "q":
+                    break
+                with self._lock:
+                    self._scroll += height
+        finally:
+            with self._lock:
+                self._scroll = None
+                self._dirty.add("output")
+
+    def _read(self, prompt="", markup: bool = True, emoji: bool = True, password: bool = False) -> str:
+        lines = self._render(self._term.render_str(prompt, markup=markup, emoji=emoji) if prompt else "", self._size[0])
+        with self._lock:
+            self._prompt_text = lines[0] if lines else ""
+            self._dirty.add("prompt")
+            self.refresh(force=True)
+            row, _ = self._regions["prompt"]
+            self._write(f"{CSI}{row + 1};{len(self._term.render_str(prompt, markup=markup).plain) + 1}H")
+            self._prompt_active = True
+        try:
+            if password:
+                import getpass
+                return getpass.getpass("")
+            return input()
+        finally:
+            with self._lock:
+                self._prompt_active = False
+                self._screen.pop(row + 1, None)
+                self._screen.pop(row, None)
+                self._write(f"{CSI}{row + 2};1H{CSI}K")
+                self._prompt_text = ""
+                self._dirty.add("prompt")
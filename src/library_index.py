@@ -0,0 +1,234 @@
+import heapq
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+# Relative weight of a match in each field when ranking tracks.
+FIELD_WEIGHTS = {"name": 1.0, "artists": 0.8, "album": 0.5}
+# Minimum trigram similarity for a library word to count as a (fuzzy) match.
+MIN_SIMILARITY = 0.34
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace."""
+    text = text or ""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def trigrams(word: str) -> set:
+    """Trigrams of a word, padded so one- and two-letter words still have some."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _track_words(track):
+    return {
+        "name": normalize_text(track.name).split(),
+        "artists": normalize_text(" ".join(track.artists)).split(),
+        "album": normalize_text(track.album).split(),
+    }
+
+
+class LibraryIndex:
+    """
+    In-memory inverted index over the tracks of the user's playlists.
+
+    Every word of a track's title, artists and album points to the tracks it
+    appears in, and every distinct word is itself indexed by trigram. A query
+    word is first matched against the vocabulary (exactly, as a prefix, or by
+    trigram similarity for typos), and the postings of the matching words are
+    then scored per track, so the work per query is proportional to the hits,
+    not the size of the library.
+
+    Each track is indexed once by URI, however many playlists it appears in.
+    Playlists are indexed by snapshot_id: an unchanged snapshot is skipped,
+    and a changed one only adds and removes the tracks that differ.
+    """
+
+    def __init__(self, loader=None):
+        """
+        Parameters:
+            loader (callable, optional): Returns (playlist_id, snapshot_id, items)
+                tuples used to fill the index on first search, e.g. from the playlist cache.
+        """
+        self._loader = loader
+        self._loaded = loader is None
+        self._lock = threading.RLock()
+        self._tracks = {}      # uri -> (track, words by field, playlist ids)
+        self._postings = {}    # word -> {uri: best field weight}
+        self._vocab = {}       # trigram -> set of words
+        self._playlists = {}   # playlist id -> (snapshot_id, set of uris)
+
+    def __len__(self):
+        return len(self._tracks)
+
+    @property
+    def playlist_count(self) -> int:
+        return len(self._playlists)
+
+    # ------------------ Updates ------------------ #
+    def update_playlist(self, playlist_id: str, snapshot_id: str, items: list):
+        """
+        Index the items of a playlist snapshot, applying only the difference
+        from the snapshot indexed before.
+
+        Parameters:
+            playlist_id (str): Spotify playlist ID.
+            snapshot_id (str): Snapshot the items belong to.
+            items (list): PlaylistEntry records.
+        """
+        with self._lock:
+            old_snapshot, old_uris = self._playlists.get(playlist_id, (None, set()))
+            if snapshot_id and snapshot_id == old_snapshot:
+                return
+            tracks = {}
+            for entry in items:
+                if entry.track.uri:
+                    tracks[entry.track.uri] = entry.track
+            for uri in old_uris - tracks.keys():
+                self._unlink(uri, playlist_id)
+            for uri in tracks.keys() - old_uris:
+                self._link(uri, tracks[uri], playlist_id)
+            self._playlists[playlist_id] = (snapshot_id, set(tracks))
+
+    def remove_playlist(self, playlist_id: str):
+        """Drop a playlist and every track that appears in no other playlist."""
+        with self._lock:
+            _, uris = self._playlists.pop(playlist_id, (None, set()))
+            for uri in uris:
+                self._unlink(uri, playlist_id)
+
+    def _link(self, uri: str, track, playlist_id: str):
+        entry = self._tracks.get(uri)
+        if entry is not None:
+            entry[2].add(playlist_id)
+            return
+        words = _track_words(track)
+        self._tracks[uri] = (track, words, {playlist_id})
+        for field, weight in FIELD_WEIGHTS.items():
+            for word in words[field]:
+                posting = self._postings.get(word)
+                if posting is None:
+                    posting = self._postings[word] = {}
+                    for gram in trigrams(word):
+                        self._vocab.setdefault(gram, set()).add(word)
+                if posting.get(uri, 0) < weight:
+                    posting[uri] = weight
+
+    def _unlink(self, uri: str, playlist_id: str):
+        entry = self._tracks.get(uri)
+        if entry is None:
+            return
+        _, words, playlists = entry
+        playlists.discard(playlist_id)
+        if playlists:
+            return
+        del self._tracks[uri]
+        for field_words in words.values():
+            for word in field_words:
+                posting = self._postings.get(word)
+                if posting is None:
+                    continue
+                posting.pop(uri, None)
+                if not posting:
+                    del self._postings[word]
+                    for gram in trigrams(word):
+                        bucket = self._vocab.get(gram)
+                        if bucket is not None:
+                            bucket.discard(word)
+                            if not bucket:
+                                del self._vocab[gram]
+
+    def ensure_loaded(self):
+        """Fill the index from the loader once, skipping playlists already indexed."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            for playlist_id, snapshot_id, items in self._loader():
+                if playlist_id not in self._playlists:
+                    self.update_playlist(playlist_id, snapshot_id, items)
+            self._loaded = True
+
+    # ------------------ Queries ------------------ #
+    def _similar_words(self, word: str):
+        """
+        Library words matching a query word, with a similarity in (0, 1].
+
+        An exact match scores 1, a word the query is a prefix of 0.9, and
+        anything else its trigram Dice coefficient if at least MIN_SIMILARITY.
+        """
+        grams = trigrams(word)
+        shared = Counter()
+        for gram in grams:
+            bucket = self._vocab.get(gram)
+            if bucket:
+                shared.update(bucket)
+        matches = {}
+        for candidate, n in shared.items():
+            if candidate == word:
+                matches[candidate] = 1.0
+            elif len(word) >= 2 and candidate.startswith(word):
+                matches[candidate] = 0.9
+            else:
+                similarity = 2 * n / (len(grams) + len(candidate) + 1)
+                if similarity >= MIN_SIMILARITY:
+                    matches[candidate] = similarity
+        return matches
+
+    def search(self, query: str, limit: int = 5):
+        """
+        Find the tracks best matching a free-text query.
+
+        Parameters:
+            query (str): Title, artist and/or album words; typos and partial words are tolerated.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: Matching Track records, best first.
+        """
+        self.ensure_loaded()
+        normalized = normalize_text(query)
+        words = normalized.split()
+        if not words:
+            return []
+
+        with self._lock:
+            scores = {}
+            for i, word in enumerate(dict.fromkeys(words)):
+                matches = sorted(self._similar_words(word).items(), key=lambda kv: -kv[1])
+                best = {}
+                for match, similarity in matches:
+                    posting = self._postings[match]
+                    if not best:
+                        best = {uri: similarity * weight for uri, weight in posting.items()}
+                        continue
+                    for uri, weight in posting.items():
+                        score = similarity * weight
+                        if score > best.get(uri, 0):
+                            best[uri] = score
+                if i == 0:
+                    scores = best
+                else:
+                    for uri, score in best.items():
+                        scores[uri] = scores.get(uri, 0) + score
+
+            candidates = heapq.nlargest(max(limit * 4, 20), scores.items(), key=lambda kv: kv[1])
+            ranked = []
+            for uri, score in candidates:
+                track, track_words, _ = self._tracks[uri]
+                name = " ".join(track_words["name"])
+                # Whole-phrase matches first, then titles with fewer unmatched words.
+                if normalized == name:
+                    score += 1.0
+                elif normalized in name or normalized in " ".join(track_words["artists"]):
+                    score += 0.5
+                score -= 0.01 * max(0, len(track_words["name"]) - len(words))
+                ranked.append((score, name, uri))
+            return [self._tracks[uri][0] for _, _, uri in heapq.nlargest(limit, ranked)]
@@ -0,0 +1,232 @@
+import json
+import math
+import threading
+import time
+from collections import deque
+
+from rich.console import Console
+
+# Histogram bucket upper bounds in seconds; the last bucket is open-ended.
+BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SPARK = " ▁▂▃▄▅▆▇█"
+
+
+class TimedConsole(Console):
+    """Console that accumulates the time spent rendering in print()."""
+
+    render_seconds = 0.0
+
+    def print(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            super().print(*args, **kwargs)
+        finally:
+            self.render_seconds += time.perf_counter() - start
+
+
+class _Series:
+    """Latency series with a bounded sample window and cumulative histogram."""
+
+    def __init__(self, window: int = 1000):
+        self.samples = deque(maxlen=window)
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+    def sparkline(self) -> str:
+        peak = max(self.buckets) or 1
+        return "".join(SPARK[math.ceil(n / peak * (len(SPARK) - 1))] for n in self.buckets)
+
+
+class _CommandSeries(_Series):
+    def __init__(self):
+        super().__init__()
+        self.http_calls = 0
+        self.retries = 0
+        self.http_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.render_seconds = 0.0
+
+
+class Metrics:
+    """
+    Per-command and per-endpoint timing and traffic counters.
+
+    A command is bracketed with command(); every HTTP response, retry and
+    playback wait recorded while it runs is attributed to it. Spotify client
+    calls are timed per method through timed_call().
+    """
+
+    def __init__(self):
+        self.commands = {}
+        self.endpoints = {}
+        self.http_calls = 0
+        self.retries = 0
+        self._current = None
+        self._lock = threading.Lock()
+
+    # ------------------ Recording ------------------ #
+    def command(self, name: str, console=None):
+        """
+        Context manager timing a command; render time is read from a TimedConsole.
+        """
+        return _CommandTimer(self, name, console)
+
+    def timed_call(self, name: str, func):
+        """Wrap a Spotify client method so every call is timed under its name."""
+        def call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self.endpoints.setdefault(name, _Series()).errors += 1
+                raise
+            finally:
+                with self._lock:
+                    self.endpoints.setdefault(name, _Series()).observe(time.perf_counter() - start)
+        return call
+
+    def on_transport_event(self, event: str, seconds: float = 0.0, **info):
+        """Listener for transport.add_listener counting HTTP calls and retries."""
+        with self._lock:
+            current = self._current
+            if event == "response":
+                self.http_calls += 1
+                if current:
+                    current.http_calls += 1
+                    current.http_seconds += seconds
+            elif event == "retry":
+                self.retries += 1
+                self.http_calls += 1
+                if current:
+                    current.retries += 1
+                    current.http_calls += 1
+
+    def add_wait(self, seconds: float):
+        """Record time spent waiting for playback to change."""
+        with self._lock:
+            if self._current:
+                self._current.wait_seconds += seconds
+
+    # ------------------ Export ------------------ #
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "http_calls": self.http_calls,
+                "retries": self.retries,
+                "commands": {
+                    name: {
+                        "count": s.count,
+                        "p50_ms": round(s.percentile(50) * 1000, 2),
+                        "p95_ms": round(s.percentile(95) * 1000, 2),
+                        "total_s": round(s.total, 4),
+                        "http_calls": s.http_calls,
+                        "retries": s.retries,
+                        "http_s": round(s.http_seconds, 4),
+                        "wait_s": round(s.wait_seconds, 4),
+                        "render_s": round(s.render_seconds, 4),
+                        "buckets": dict(zip([*map(str, BUCKETS), "+Inf"], s.buckets)),
+                    }
+                    for name, s in self.commands.items()
+                },
+                "endpoints": {
+                    name: {
+                        "count": s.count,
+                        "errors": s.errors,
+                        "p50_ms": round(s.percentile(50) * 1000, 2),
+                        "p95_ms": round(s.percentile(95) * 1000, 2),
+                        "total_s": round(s.total, 4),
+                    }
+                    for name, s in self.endpoints.items()
+                },
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        lines = []
+
+        def histogram(metric: str, label: str, series: dict):
+            lines.append(f"# TYPE {metric} histogram")
+            for name, s in series.items():
+                cumulative = 0
+                for bound, n in zip([*BUCKETS, "+Inf"], s.buckets):
+                    cumulative += n
+                    lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{{label}="{name}"}} {s.total:.6f}')
+                lines.append(f'{metric}_count{{{label}="{name}"}} {s.count}')
+
+        with self._lock:
+            histogram("spotuify_command_duration_seconds", "command", self.commands)
+            histogram("spotuify_api_call_duration_seconds", "endpoint", self.endpoints)
+            for metric, attr in (
+                ("spotuify_command_http_calls_total", "http_calls"),
+                ("spotuify_command_retries_total", "retries"),
+                ("spotuify_command_http_seconds_total", "http_seconds"),
+                ("spotuify_command_wait_seconds_total", "wait_seconds"),
+                ("spotuify_command_render_seconds_total", "render_seconds"),
+            ):
+                lines.append(f"# TYPE {metric} counter")
+                for name, s in self.commands.items():
+                    lines.append(f'{metric}{{command="{name}"}} {getattr(s, attr)}')
+            lines.append("# TYPE spotuify_api_call_errors_total counter")
+            for name, s in self.endpoints.items():
+                lines.append(f'spotuify_api_call_errors_total{{endpoint="{name}"}} {s.errors}')
+            lines.append("# TYPE spotuify_http_calls_total counter")
+            lines.append(f"spotuify_http_calls_total {self.http_calls}")
+            lines.append("# TYPE spotuify_http_retries_total counter")
+            lines.append(f"spotuify_http_retries_total {self.retries}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str):
+        """Write the metrics to a file; .prom/.txt files use Prometheus text, others JSON."""
+        data = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
+
+
+class _CommandTimer:
+    def __init__(self, metrics: Metrics, name: str, console):
+        self._metrics = metrics
+        self._name = name
+        self._console = console
+
+    def __enter__(self):
+        with self._metrics._lock:
+            self._series = self._metrics.commands.setdefault(self._name, _CommandSeries())
+            self._metrics._current = self._series
+        self._render_start = getattr(self._console, "render_seconds", 0.0)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        render = getattr(self._console, "render_seconds", 0.0) - self._render_start
+        with self._metrics._lock:
+            self._series.observe(elapsed)
+            self._series.render_seconds += render
+            if exc[0] is not None and not issubclass(exc[0], SystemExit):
+                self._series.errors += 1
+            self._metrics._current = None
+        return False
@@ -0,0 +1,116 @@
+from rich.table import Table
+
+PAGER_HELP = "[dim]Enter/n next · p prev · g <page> jump · /text filter · / clear · q quit[/dim]"
+# Lines a page takes besides its rows: title, borders, header, caption and PAGER_HELP.
+PAGER_CHROME_LINES = 7
+
+
+class PagedView:
+    """
+    Page-at-a-time table viewer for long item lists.
+
+    Only the rows of the visible page are built into a Table and rendered,
+    so the cost of showing a page does not depend on the size of the list.
+    The source only has to provide len() and window(start, stop), e.g. a
+    pagination.LazyPages that downloads pages as they come into view; a
+    filter needs every row, so the source's all() is called the first time
+    one is applied.
+    """
+
+    def __init__(self, source, title: str, columns, row, matches, page_size: int = 25):
+        """
+        Parameters:
+            source: Object with __len__, window(start, stop) and all(); a plain list also works.
+            title (str): Table title.
+            columns (list): (header, style) pairs.
+            row (callable): Called as row(index, item), returns the cell strings.
+            matches (callable): Called as matches(item, text), tells whether a row passes the filter.
+            page_size (int): Rows per page.
+        """
+        self._source = source
+        self._title = title
+        self._columns = columns
+        self._row = row
+        self._matches = matches
+        self.page_size = max(1, page_size)
+        self.page = 0
+        self.filter_text = ""
+        self._filtered = None
+
+    # ------------------ Data ------------------ #
+    def __len__(self):
+        return len(self._filtered) if self._filtered is not None else len(self._source)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self) // self.page_size))
+
+    def _window(self, start: int, stop: int):
+        if self._filtered is not None:
+            return self._filtered[start:stop]
+        if isinstance(self._source, list):
+            return list(enumerate(self._source[start:stop], start))
+        return list(enumerate(self._source.window(start, stop), start))
+
+    def set_filter(self, text: str):
+        """Show only rows matching text (blank clears the filter) and go back to the first page."""
+        self.filter_text = text.strip()
+        if not self.filter_text:
+            self._filtered = None
+        else:
+            items = self._source if isinstance(self._source, list) else self._source.all()
+            self._filtered = [(i, item) for i, item in enumerate(items) if self._matches(item, self.filter_text)]
+        self.page = 0
+
+    def jump(self, page: int):
+        """Go to a page, clamped to the valid range."""
+        self.page = max(0, min(page, self.page_count - 1))
+
+    # ------------------ Rendering ------------------ #
+    def render(self) -> Table:
+        """Build the table for the current page only."""
+        start = self.page * self.page_size
+        rows = self._window(start, start + self.page_size)
+        caption = f"Page {self.page + 1}/{self.page_count} · {len(self)} rows"
+        if self.filter_text:
+            caption += f" matching '{self.filter_text}'"
+        table = Table(title=self._title, caption=caption)
+        for header, style in self._columns:
+            table.add_column(header, style=style)
+        for index, item in rows:
+            table.add_row(*self._row(index, item))
+        return table
+
+    def handle(self, command: str) -> bool:
+        """
+        Apply one pager command.
+
+        Returns:
+            bool: False when the viewer should close.
+        """
+        command = command.strip()
+        if command.lower() in ("q", "quit"):
+            return False
+        if command.startswith("/"):
+            self.set_filter(command[1:])
+        elif command.lower() in ("", "n", "next"):
+            if self.page + 1 >= self.page_count:
+                return False
+            self.page += 1
+        elif command.lower() in ("p", "prev"):
+            self.jump(self.page - 1)
+        else:
+            target = command[1:] if command.lower().startswith("g") else command
+            try:
+                self.jump(int(target.strip()) - 1)
+            except ValueError:
+                pass
+        return True
+
+    def run(self, console):
+        """Show pages and read pager commands until the user quits or pages past the end."""
+        while True:
+            console.print(self.render())
+            console.print(PAGER_HELP)
+            if not self.handle(console.input("Page: ")):
+                return
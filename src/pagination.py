@@ -0,0 +1,162 @@
+# Callables that adapt a page fetch before it is handed to a worker pool; see add_worker_context.
+_worker_contexts = []
+
+
+def add_worker_context(carry):
+    """
+    Register a callable that carries the submitting thread's context onto page workers.
+
+    carry(fn) is called on the thread that hands pages to a worker pool and
+    returns fn wrapped to run with that thread's state, e.g. its request
+    priority, on the pool's threads.
+    """
+    _worker_contexts.append(carry)
+
+
+def _carry(fn):
+    for carry in _worker_contexts:
+        fn = carry(fn)
+    return fn
+
+
+def iter_pages(fetch_page, limit: int = 100, workers: int = 4):
+    """
+    Yield the pages of an offset-paginated Spotify endpoint as they arrive.
+
+    The first page is fetched on its own to learn the total; the remaining
+    offsets are then requested concurrently on a bounded worker pool and
+    yielded in order, each as soon as it and every page before it are in.
+
+    Parameters:
+        fetch_page (callable): Called as fetch_page(offset, limit), returns a page dict
+            with "items" and "total".
+        limit (int): Page size.
+        workers (int): Maximum number of pages requested at the same time.
+
+    Returns:
+        generator: Lists of items, one per page, in order.
+    """
+    first = fetch_page(0, limit)
+    items = list(first.get("items", []))
+    yield items
+    total = first.get("total") or 0
+    if len(items) < limit or total <= len(items):
+        return
+
+    offsets = range(limit, total, limit)
+    if workers <= 1:
+        for offset in offsets:
+            yield list(fetch_page(offset, limit).get("items", []))
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    fetch = _carry(lambda offset: fetch_page(offset, limit))
+    with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as pool:
+        for page in pool.map(fetch, offsets):
+            yield list(page.get("items", []))
+
+
+def fetch_all_pages(fetch_page, limit: int = 100, workers: int = 4):
+    """
+    Fetch every item of an offset-paginated Spotify endpoint.
+
+    Parameters:
+        fetch_page (callable): Called as fetch_page(offset, limit), returns a page dict
+            with "items" and "total".
+        limit (int): Page size.
+        workers (int): Maximum number of pages requested at the same time.
+
+    Returns:
+        list: All items in order.
+    """
+    return [item for page in iter_pages(fetch_page, limit, workers) for item in page]
+
+
+class LazyPages:
+    """
+    Read-only view of an offset-paginated endpoint that fetches pages on access.
+
+    Only the pages covering a requested window are downloaded. all() fetches
+    whatever is still missing concurrently and, once every page is in, calls
+    on_complete with the full list (e.g. to store it in a cache).
+    """
+
+    def __init__(self, fetch_page, total: int, page_size: int = 100, first_page=None, workers: int = 4,
+                 on_complete=None):
+        """
+        Parameters:
+            fetch_page (callable): Called as fetch_page(offset, limit), returns a page dict with "items".
+            total (int): Total number of items.
+            page_size (int): Items per request.
+            first_page (list, optional): Items of the page at offset 0, if already fetched.
+            workers (int): Maximum number of pages requested at the same time by all().
+            on_complete (callable, optional): Called once with every item when all pages are in.
+        """
+        self._fetch_page = fetch_page
+        self._total = total
+        self._page_size = page_size
+        self._workers = workers
+        self._on_complete = on_complete
+        self._pages = {}
+        if first_page is not None:
+            self._pages[0] = list(first_page)
+        self._check_complete()
+
+    def __len__(self):
+        return self._total
+
+    @property
+    def pages_fetched(self) -> int:
+        return len(self._pages)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every page has been fetched."""
+        return len(self._pages) >= self._page_count()
+
+    def _page_count(self) -> int:
+        return -(-self._total // self._page_size)
+
+    def _load(self, page: int):
+        if page not in self._pages:
+            data = self._fetch_page(page * self._page_size, self._page_size)
+            self._pages[page] = list(data.get("items", []))
+            self._check_complete()
+
+    def _check_complete(self):
+        if self._on_complete and len(self._pages) >= self._page_count():
+            callback, self._on_complete = self._on_complete, None
+            callback(self._items())
+
+    def _items(self):
+        return [item for page in range(self._page_count()) for item in self._pages.get(page, [])]
+
+    def window(self, start: int, stop: int) -> list:
+        """Return items[start:stop], fetching only the pages that cover it."""
+        start, stop = max(0, start), min(stop, self._total)
+        if start >= stop:
+            return []
+        first, last = start // self._page_size, (stop - 1) // self._page_size
+        for page in range(first, last + 1):
+            self._load(page)
+        items = [item for page in range(first, last + 1) for item in self._pages[page]]
+        offset = first * self._page_size
+        return items[start - offset:stop - offset]
+
+    def all(self) -> list:
+        """Return every item, fetching the missing pages concurrently."""
+        missing = [page for page in range(self._page_count()) if page not in self._pages]
+        if len(missing) > 1 and self._workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            fetch = _carry(lambda page: self._fetch_page(page * self._page_size, self._page_size))
+            with ThreadPoolExecutor(max_workers=min(self._workers, len(missing))) as pool:
+                fetched = pool.map(fetch, missing)
+                for page, data in zip(missing, fetched):
+                    self._pages[page] = list(data.get("items", []))
+            self._check_complete()
+        else:
+            for page in missing:
+                self._load(page)
+        return self._items()
@@ -0,0 +1,227 @@
+import threading
+import time
+
+
+def playback_changed(before, after) -> bool:
+    """
+    Tell whether a playback state differs from an earlier snapshot.
+
+    A change is a different track, a different play/pause state, a different
+    context, or the same track restarting from the beginning.
+
+    Parameters:
+        before (dict or None): Playback state from before a command.
+        after (dict or None): Playback state to compare against it.
+
+    Returns:
+        bool: True if the state has changed.
+    """
+    if not before or not after:
+        return bool(before) != bool(after)
+
+    before_item = before.get("item") or {}
+    after_item = after.get("item") or {}
+    if before_item.get("id") != after_item.get("id"):
+        return True
+    if before.get("is_playing") != after.get("is_playing"):
+        return True
+    if (before.get("context") or {}).get("uri") != (after.get("context") or {}).get("uri"):
+        return True
+    return after.get("progress_ms", 0) + 1000 < before.get("progress_ms", 0)
+
+
+def wait_for_playback_change(fetch, before, timeout: float = 2.0, first_delay: float = 0.05, max_delay: float = 0.4):
+    """
+    Poll the playback state with exponential backoff until it differs from a snapshot.
+
+    Parameters:
+        fetch (callable): Returns the current playback state (e.g. sp.current_playback).
+        before (dict or None): Playback state taken before the command was sent.
+        timeout (float): Seconds to keep polling before giving up.
+        first_delay (float): Delay before the first poll, doubled after each poll.
+        max_delay (float): Upper bound for the delay between polls.
+
+    Returns:
+        dict or None: The most recently fetched playback state.
+    """
+    deadline = time.monotonic() + timeout
+    delay = first_delay
+    playback = before
+    while True:
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        try:
+            playback = fetch()
+        except Exception:
+            pass
+        if playback_changed(before, playback) or time.monotonic() >= deadline:
+            return playback
+        delay = min(delay * 2, max_delay)
+
+
+def extrapolate_progress(playback, elapsed: float):
+    """
+    Advance a playback state's progress by the time elapsed since it was known.
+
+    Parameters:
+        playback (dict or None): Playback state.
+        elapsed (float): Seconds since progress_ms was accurate.
+
+    Returns:
+        dict or None: A copy with progress_ms moved on (capped at the track's
+        duration) while playing; the state itself when paused or empty.
+    """
+    if not playback or not playback.get("is_playing"):
+        return playback
+    progress = playback.get("progress_ms", 0) + int(elapsed * 1000)
+    duration = (playback.get("item") or {}).get("duration_ms")
+    if duration:
+        progress = min(progress, duration)
+    return {**playback, "progress_ms": progress}
+
+
+class PlaybackState:
+    """
+    Shared, thread-safe copy of the current playback state.
+
+    A background thread keeps the state fresh. While a track plays, its
+    progress is extrapolated locally from a monotonic clock (see live()), so
+    the API is only polled when the track should end, every `interval`
+    seconds to correct drift, and shortly after a command changes something.
+    Commands read the last known state without blocking, apply their own
+    changes to it optimistically, and the refresher confirms them.
+    """
+
+    def __init__(self, fetch, interval: float = 30.0, confirm_delay: float = 0.5, boundary_slack: float = 0.5):
+        """
+        Parameters:
+            fetch (callable): Returns the current playback state from the API.
+            interval (float): Seconds between drift checks.
+            confirm_delay (float): Seconds after a change before it is confirmed.
+            boundary_slack (float): Seconds after the expected end of a track before
+                fetching the next one.
+        """
+        self._fetch = fetch
+        self.interval = interval
+        self.confirm_delay = confirm_delay
+        self.boundary_slack = boundary_slack
+        self._state = None
+        self._fetched_at = None
+        self._progress_at = None
+        self._next_refresh = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background refresher thread if it is not already running."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="playback-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresher thread."""
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                delay = self._next_refresh - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+            try:
+                self.refresh()
+            except Exception:
+                with self._lock:
+                    self._next_refresh = time.monotonic() + self.interval
+
+    def refresh(self):
+        """
+        Fetch the playback state now and store it.
+
+        Returns:
+            dict or None: The fetched playback state.
+        """
+        playback = self._fetch()
+        self.store(playback)
+        return playback
+
+    def get(self, max_age: float = None):
+        """
+        Return the last known playback state.
+
+        Parameters:
+            max_age (float, optional): If given, refresh synchronously when the stored
+                state is older than this many seconds or has never been fetched.
+
+        Returns:
+            dict or None: Playback state, or None if nothing is playing.
+        """
+        with self._lock:
+            state = self._state
+            fetched_at = self._fetched_at
+        if fetched_at is None or (max_age is not None and time.monotonic() - fetched_at > max_age):
+            try:
+                return self.refresh()
+            except Exception:
+                return state
+        return state
+
+    def peek(self):
+        """Return the last known playback state without ever fetching it."""
+        with self._lock:
+            return self._state
+
+    def live(self):
+        """Return the last known playback state with progress_ms extrapolated to now; never fetches."""
+        with self._lock:
+            return self._live_locked()
+
+    def _live_locked(self):
+        if self._progress_at is None:
+            return self._state
+        return extrapolate_progress(self._state, time.monotonic() - self._progress_at)
+
+    def update(self, confirm: bool = True, **changes):
+        """
+        Apply a change optimistically and schedule a refresh to confirm it.
+
+        Parameters:
+            confirm (bool): Schedule the confirming refresh. Pass False while the
+                change has not been sent yet, so a refresh does not undo it early.
+            **changes: Top-level playback fields to overwrite, e.g. shuffle_state=True.
+        """
+        with self._lock:
+            if self._state is not None:
+                if "is_playing" in changes or "progress_ms" in changes:
+                    # Keep the progress made so far; it is extrapolated from now on.
+                    self._state = {**self._live_locked(), **changes}
+                    self._progress_at = time.monotonic()
+                else:
+                    self._state = {**self._state, **changes}
+            if confirm:
+                self._next_refresh = time.monotonic() + self.confirm_delay
+        if confirm:
+            self._wake.set()
+
+    def store(self, playback):
+        """Store a playback state fetched elsewhere, e.g. while waiting for a change."""
+        with self._lock:
+            self._state = playback
+            self._fetched_at = self._progress_at = time.monotonic()
+            self._next_refresh = self._fetched_at + self._until_refresh(playback)
+
+    def _until_refresh(self, playback) -> float:
+        """Seconds until the next poll: the drift check, or the end of the playing track if sooner."""
+        wait = self.interval
+        if playback and playback.get("is_playing"):
+            duration = (playback.get("item") or {}).get("duration_ms")
+            if duration:
+                remaining = max(0, duration - playback.get("progress_ms", 0)) / 1000
+                wait = min(wait, remaining + self.boundary_slack)
+        return wait
@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from records import PlaylistEntry, Track
+
+
+# Bumped whenever the stored row format changes; older caches are discarded.
+SCHEMA_VERSION = 2
+
+
+def _entry(position: int, data: str) -> PlaylistEntry:
+    return PlaylistEntry(Track.from_row(json.loads(data)), position)
+
+
+class PlaylistCache:
+    """
+    On-disk cache of playlist tracks, keyed by playlist ID and Spotify's snapshot_id.
+
+    A playlist's snapshot_id changes whenever its contents change, so a cached
+    entry is valid exactly as long as the snapshot it was stored under.
+    """
+
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        except (OSError, sqlite3.Error):
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+
+        with self._lock, self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS playlists")
+                self._conn.execute("DROP TABLE IF EXISTS tracks")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS playlists ("
+                "id TEXT PRIMARY KEY, snapshot_id TEXT, name TEXT, total INTEGER, fetched_at REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tracks ("
+                "playlist_id TEXT, position INTEGER, data TEXT, "
+                "PRIMARY KEY (playlist_id, position))"
+            )
+
+    def get(self, playlist_id: str, snapshot_id: str):
+        """
+        Return the cached items of a playlist if they match the given snapshot.
+
+        Parameters:
+            playlist_id (str): Spotify playlist ID.
+            snapshot_id (str): Current snapshot_id of the playlist.
+
+        Returns:
+            list or None: Cached PlaylistEntry records in order, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot_id FROM playlists WHERE id = ?", (playlist_id,)
+            ).fetchone()
+            if not row or not snapshot_id or row[0] != snapshot_id:
+                return None
+            rows = self._conn.execute(
+                "SELECT position, data FROM tracks WHERE playlist_id = ? ORDER BY position", (playlist_id,)
+            ).fetchall()
+        return [_entry(position, data) for position, data in rows]
+
+    def view(self, playlist_id: str, snapshot_id: str):
+        """
+        Return a windowed view of a cached playlist that reads only the rows it is asked for.
+
+        Parameters:
+            playlist_id (str): Spotify playlist ID.
+            snapshot_id (str): Current snapshot_id of the playlist.
+
+        Returns:
+            CachedPlaylist or None: The view, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot_id, total FROM playlists WHERE id = ?", (playlist_id,)
+            ).fetchone()
+        if not row or not snapshot_id or row[0] != snapshot_id:
+            return None
+        return CachedPlaylist(self, playlist_id, snapshot_id, row[1] or 0)
+
+    def window(self, playlist_id: str, start: int, stop: int):
+        """Return the cached entries at positions start..stop-1 of a playlist."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT position, data FROM tracks WHERE playlist_id = ? AND position >= ? AND position < ? "
+                "ORDER BY position",
+                (playlist_id, start, stop),
+            ).fetchall()
+        return [_entry(position, data) for position, data in rows]
+
+    def store(self, playlist_id: str, snapshot_id: str, entries: list, name: str = None):
+        """
+        Replace the cached items of a playlist with a freshly fetched snapshot.
+
+        Parameters:
+            playlist_id (str): Spotify playlist ID.
+            snapshot_id (str): Snapshot the items were fetched under.
+            entries (list): PlaylistEntry records in playlist order.
+            name (str, optional): Playlist name.
+
+        Returns:
+            list: The stored entries, renumbered from position 0.
+        """
+        entries = [e if e.position == i else PlaylistEntry(e.track, i) for i, e in enumerate(entries)]
+        if not snapshot_id:
+            return entries
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tracks WHERE playlist_id = ?", (playlist_id,))
+            self._conn.executemany(
+                "INSERT INTO tracks (playlist_id, position, data) VALUES (?, ?, ?)",
+                ((playlist_id, e.position, json.dumps(e.track.to_row())) for e in entries),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlists (id, snapshot_id, name, total, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (playlist_id, snapshot_id, name, len(entries), time.time()),
+            )
+        return entries
+
+    def recent(self, limit: int = 3):
+        """Return the IDs of the most recently stored playlists, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM playlists ORDER BY fetched_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [playlist_id for (playlist_id,) in rows]
+
+    def iter_playlists(self):
+        """
+        Yield every cached playlist as (playlist_id, snapshot_id, items).
+
+        Returns:
+            generator: One tuple per cached playlist, entries in order.
+        """
+        with self._lock:
+            playlists = self._conn.execute("SELECT id, snapshot_id FROM playlists").fetchall()
+            rows = self._conn.execute(
+                "SELECT playlist_id, position, data FROM tracks ORDER BY playlist_id, position"
+            ).fetchall()
+        items = {}
+        for playlist_id, position, data in rows:
+            items.setdefault(playlist_id, []).append(_entry(position, data))
+        for playlist_id, snapshot_id in playlists:
+            yield playlist_id, snapshot_id, items.get(playlist_id, [])
+
+
+class CachedPlaylist:
+    """Cached playlist read a window at a time; see PlaylistCache.view()."""
+
+    def __init__(self, cache: PlaylistCache, playlist_id: str, snapshot_id: str, total: int):
+        self._cache = cache
+        self._playlist_id = playlist_id
+        self._snapshot_id = snapshot_id
+        self._total = total
+
+    def __len__(self):
+        return self._total
+
+    def window(self, start: int, stop: int) -> list:
+        return self._cache.window(self._playlist_id, max(0, start), stop)
+
+    def all(self) -> list:
+        return self._cache.get(self._playlist_id, self._snapshot_id) or []
@@ -0,0 +1,65 @@
+import threading
+
+
+class Prefetcher:
+    """
+    Runs warm-up tasks on a background thread while the user is idle at the prompt.
+
+    Each task is a callable returning an iterable that makes at most one
+    request per step, e.g. a generator that yields after every request.
+    idle() starts a pass after idle_delay seconds; cancel(), called when a
+    foreground command starts, stops the pass at the next step boundary, so
+    background work never holds the connection pool while a command runs.
+    """
+
+    def __init__(self, tasks, idle_delay: float = 0.5):
+        """
+        Parameters:
+            tasks (list): Callables returning iterables of prefetch steps, run in order.
+            idle_delay (float): Seconds the prompt must be idle before prefetching starts.
+        """
+        self._tasks = list(tasks)
+        self.idle_delay = idle_delay
+        self._idle = threading.Event()
+        self._cancel = threading.Event()
+        self._thread = None
+        self.steps = 0
+        self.passes = 0
+        self.cancelled = 0
+
+    def idle(self):
+        """Signal that the user is at the prompt; prefetching may start after idle_delay."""
+        self._cancel.clear()
+        self._idle.set()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="prefetcher", daemon=True)
+            self._thread.start()
+
+    def cancel(self):
+        """Stop any pass in progress at its next step; called when a foreground command starts."""
+        self._idle.clear()
+        self._cancel.set()
+
+    def _run(self):
+        while True:
+            self._idle.wait()
+            # Wait out the idle delay; a command starting in the meantime cancels the pass.
+            if self._cancel.wait(self.idle_delay):
+                continue
+            self._idle.clear()
+            self._pass()
+
+    def _pass(self):
+        for task in self._tasks:
+            try:
+                for _ in task():
+                    self.steps += 1
+                    if self._cancel.is_set():
+                        self.cancelled += 1
+                        return
+            except Exception:
+                continue
+            if self._cancel.is_set():
+                self.cancelled += 1
+                return
+        self.passes += 1
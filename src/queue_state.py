@@ -0,0 +1,79 @@
+import threading
+from collections import Counter, deque
+
+from records import Track
+
+
+class QueueState:
+    """
+    Bounded mirror of Spotify's play queue that remembers which tracks were queued here.
+
+    Tracks queued from the controller are kept in a deque of at most
+    max_size entries. reconcile() takes one sp.queue() response: it drops
+    the locally queued tracks that are no longer upcoming (they have played
+    or were skipped), and it rebuilds the upcoming list reusing the Track
+    records of tracks that were already known, so only new tracks are parsed.
+    """
+
+    def __init__(self, max_size: int = 50):
+        self.max_size = max_size
+        self.added = deque(maxlen=max_size)
+        self.upcoming = []
+        self.current = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.added)
+
+    def add(self, track: Track):
+        """Record a track queued from this controller."""
+        with self._lock:
+            self.added.append(track)
+
+    def reconcile(self, response: dict) -> int:
+        """
+        Bring the mirror up to date with a sp.queue() response.
+
+        Parameters:
+            response (dict): {"currently_playing": track, "queue": [tracks]} from the API.
+
+        Returns:
+            int: Number of locally queued tracks dropped because they have played.
+        """
+        response = response or {}
+        with self._lock:
+            known = {t.uri: t for t in self.upcoming}
+            if self.current is not None:
+                known.setdefault(self.current.uri, self.current)
+
+            def record(item):
+                uri = (item or {}).get("uri")
+                return (known.get(uri) or Track.from_api(item)) if uri else None
+
+            self.current = record(response.get("currently_playing"))
+            self.upcoming = [t for t in map(record, (response.get("queue") or [])[:self.max_size]) if t]
+
+            # Spotify plays queued tracks first-in first-out, so the locally queued
+            # tracks still waiting are a suffix of self.added.
+            remaining = Counter(t.uri for t in self.upcoming)
+            waiting = 0
+            for track in reversed(self.added):
+                if remaining[track.uri] <= 0:
+                    break
+                remaining[track.uri] -= 1
+                waiting += 1
+            dropped = len(self.added) - waiting
+            for _ in range(dropped):
+                self.added.popleft()
+            return dropped
+
+    def added_here(self):
+        """Indices into upcoming of the tracks that were queued from this controller."""
+        with self._lock:
+            marks, pending = set(), list(self.added)
+            j = 0
+            for i, track in enumerate(self.upcoming):
+                if j < len(pending) and track.uri == pending[j].uri:
+                    marks.add(i)
+                    j += 1
+            return marks
@@ -0,0 +1,71 @@
+class Track:
+    """
+    Compact track record holding only what the controller displays or uses.
+
+    Built once from the Spotify JSON when a response is parsed; the markets,
+    images and full album/artist objects are dropped right away. Artists are
+    a tuple of names and the album is just its name.
+    """
+
+    __slots__ = ("id", "uri", "name", "artists", "album", "duration_ms")
+
+    def __init__(self, id=None, uri=None, name="Unknown", artists=(), album=None, duration_ms=0):
+        self.id = id
+        self.uri = uri
+        self.name = name
+        self.artists = tuple(artists)
+        self.album = album
+        self.duration_ms = duration_ms
+
+    @classmethod
+    def from_api(cls, track):
+        """Build a Track from a Spotify track object (None for unavailable items)."""
+        track = track or {}
+        return cls(
+            track.get("id"),
+            track.get("uri"),
+            track.get("name") or "Unknown",
+            (a.get("name") or "Unknown" for a in track.get("artists") or ()),
+            (track.get("album") or {}).get("name"),
+            track.get("duration_ms") or 0,
+        )
+
+    @property
+    def artist_names(self) -> str:
+        return ", ".join(self.artists) or "Unknown"
+
+    def to_row(self) -> list:
+        """Serialize to a JSON-friendly list, the inverse of from_row."""
+        return [self.id, self.uri, self.name, list(self.artists), self.album, self.duration_ms]
+
+    @classmethod
+    def from_row(cls, row):
+        if not isinstance(row, list):
+            raise TypeError(f"not a track row: {row!r}")
+        return cls(*row)
+
+    def __repr__(self):
+        return f"Track({self.name!r}, {self.artist_names!r}, uri={self.uri!r})"
+
+
+class PlaylistEntry:
+    """A track at a position in a playlist."""
+
+    __slots__ = ("track", "position")
+
+    def __init__(self, track: Track, position: int):
+        self.track = track
+        self.position = position
+
+    @classmethod
+    def from_api(cls, item, position: int):
+        """Build an entry from a playlist_items item."""
+        return cls(Track.from_api((item or {}).get("track")), position)
+
+    def __repr__(self):
+        return f"PlaylistEntry({self.position}, {self.track!r})"
+
+
+def entries_from_page(page: dict, offset: int = 0):
+    """Turn a playlist_items page into PlaylistEntry records numbered from offset."""
+    return [PlaylistEntry.from_api(item, offset + i) for i, item in enumerate(page.get("items", []))]
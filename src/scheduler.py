@@ -0,0 +1,231 @@
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+# Priority classes, most urgent first.
+INTERACTIVE, REFRESH, BULK = 0, 1, 2
+PRIORITY_NAMES = ("interactive", "refresh", "bulk")
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens per second up to `capacity`.
+
+    Not thread-safe on its own; Scheduler guards it with its lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._stamp = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def wait_time(self, needed: float) -> float:
+        """Seconds until at least `needed` tokens are available (0 if they already are)."""
+        self.refill()
+        return max(0.0, (needed - self.tokens) / self.rate)
+
+    def drain(self):
+        """Drop every token, e.g. after the server reported a rate limit."""
+        self.refill()
+        self.tokens = 0.0
+
+
+class Scheduler:
+    """
+    Central gate for Spotify API calls: priority ordering, rate limiting and single-flight.
+
+    Every call waits for a token from a shared bucket. Waiting calls are
+    served strictly by priority class (interactive > refresh > bulk), then
+    first come first served, and the lower classes must also leave a reserve
+    of tokens untouched, so an interactive command never waits for a refill
+    behind background traffic. Identical read calls that are in flight at
+    the same time share one request and its result.
+
+    A call's class is set with the priority() context manager; otherwise it
+    comes from its thread: the main thread is interactive, threads named in
+    thread_priorities get their class, and any other thread is bulk.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 20, is_read=None, thread_priorities=None):
+        """
+        Parameters:
+            rate (float): Sustained requests per second; 0 disables rate limiting.
+            burst (int): Bucket size, i.e. how many requests may be sent back to back.
+            is_read (callable, optional): Called as is_read(name) for a client method
+                name; True marks calls that may be deduplicated.
+            thread_priorities (dict, optional): Thread name -> default priority class.
+        """
+        self._bucket = TokenBucket(rate, burst) if rate > 0 else None
+        # Tokens the refresh and bulk classes must leave for the classes above them.
+        self._reserve = (0, max(1, burst // 10), max(2, burst // 4))
+        self._is_read = is_read or (lambda name: False)
+        self._thread_priorities = dict(thread_priorities or {})
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._seq = itertools.count()
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.calls = [0, 0, 0]
+        self.wait_seconds = [0.0, 0.0, 0.0]
+        self.shared = 0
+        self.rate_limited = 0
+
+    # ------------------ Priorities ------------------ #
+    @contextmanager
+    def priority(self, level: int):
+        """Run the calls made inside the block, on this thread, at the given priority class."""
+        previous = getattr(self._local, "level", None)
+        self._local.level = level
+        try:
+            yield
+        finally:
+            self._local.level = previous
+
+    def carry(self, fn):
+        """
+        Wrap fn so it runs at the calling thread's priority class on whichever thread calls it.
+
+        For work handed to a pool: the pool's threads are unnamed and would
+        otherwise count as bulk, even when they fetch for a foreground command.
+        """
+        level = self.current_priority()
+
+        def call(*args, **kwargs):
+            with self.priority(level):
+                return fn(*args, **kwargs)
+
+        return call
+
+    def current_priority(self) -> int:
+        level = getattr(self._local, "level", None)
+        if level is not None:
+            return level
+        thread = threading.current_thread()
+        if thread is threading.main_thread():
+            return INTERACTIVE
+        return self._thread_priorities.get(thread.name, BULK)
+
+    # ------------------ Rate limiting ------------------ #
+    def acquire(self, level: int = None):
+        """
+        Block until the calling request may be sent.
+
+        Parameters:
+            level (int, optional): Priority class, defaults to current_priority().
+        """
+        if level is None:
+            level = self.current_priority()
+        self.calls[level] += 1
+        if self._bucket is None:
+            return
+        start = time.monotonic()
+        ticket = (level, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if self._waiting[0] == ticket:
+                        delay = self._bucket.wait_time(1 + self._reserve[level])
+                        if delay <= 0:
+                            self._bucket.tokens -= 1
+                            break
+                    else:
+                        delay = None
+                    self._cond.wait(delay)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+        self.wait_seconds[level] += time.monotonic() - start
+
+    def on_transport_event(self, event: str, status: int = None, **info):
+        """
+        Listener for transport.add_listener: a 429 empties the bucket so every class backs off.
+
+        Retried 429s count as well as a final one, since a request that is
+        retried until it succeeds never produces a 429 "response" event.
+        """
+        if event in ("response", "retry") and status == 429 and self._bucket is not None:
+            with self._cond:
+                self._bucket.drain()
+                self.rate_limited += 1
+
+    # ------------------ Calls ------------------ #
+    def wrap(self, name: str, method):
+        """
+        Wrap a client method so every call goes through the scheduler.
+
+        Read calls (per is_read) with the same arguments that overlap in time
+        are sent once; every caller gets the same result object, which must
+        therefore be treated as read-only.
+        """
+        read = self._is_read(name)
+
+        def call(*args, **kwargs):
+            if not read:
+                self.acquire()
+                return method(*args, **kwargs)
+            try:
+                key = (name, args, tuple(sorted(kwargs.items())))
+                hash(key)
+            except TypeError:
+                self.acquire()
+                return method(*args, **kwargs)
+            return self._single_flight(key, lambda: method(*args, **kwargs))
+        return call
+
+    def _single_flight(self, key, run):
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self.shared += 1
+        if not leader:
+            return flight.wait()
+        try:
+            self.acquire()
+            flight.result = run()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight.done.set()
+        return flight.result
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": dict(zip(PRIORITY_NAMES, self.calls)),
+            "wait_s": dict(zip(PRIORITY_NAMES, (round(s, 3) for s in self.wait_seconds))),
+            "shared": self.shared,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class _Flight:
+    """An in-flight read call whose result is shared with identical concurrent calls."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
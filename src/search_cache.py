@@ -0,0 +1,100 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a search query and collapse its whitespace."""
+    return " ".join(query.lower().split())
+
+
+class SearchCache:
+    """
+    Bounded TTL/LRU cache of Spotify search results.
+
+    Entries are keyed by (normalized query, type, limit). The least recently
+    used entry is evicted once max_entries is reached, and entries older than
+    ttl seconds are treated as misses. When a path is given the cache is
+    loaded from and saved to that JSON file so it survives restarts; encode
+    and decode convert results to and from JSON-friendly values.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 600, path: str = None, encode=None, decode=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._encode = encode or (lambda results: results)
+        self._decode = decode or (lambda results: results)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _key(query: str, search_type: str, limit: int) -> str:
+        return f"{search_type}|{limit}|{normalize_query(query)}"
+
+    def get(self, query: str, search_type: str = "track", limit: int = 5):
+        """
+        Look up cached search results.
+
+        Returns:
+            list or None: Cached result items, or None on a miss or expired entry.
+        """
+        key = self._key(query, search_type, limit)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] > self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, query: str, results: list, search_type: str = "track", limit: int = 5):
+        """Store search results, evicting the least recently used entry when full."""
+        key = self._key(query, search_type, limit)
+        with self._lock:
+            self._entries[key] = (time.time(), results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._save()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, list):
+            return
+        now = time.time()
+        for entry in data[-self.max_entries:]:
+            # Skip anything that isn't a well-formed [key, stamp, results] entry.
+            try:
+                key, stamp, results = entry
+                if now - stamp <= self.ttl:
+                    self._entries[key] = (stamp, self._decode(results))
+            except (TypeError, ValueError, KeyError):
+                continue
+
+    def _save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = [[key, stamp, self._encode(results)] for key, (stamp, results) in self._entries.items()]
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
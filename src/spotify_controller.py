@@ -1,23 +1,30 @@
 #!/usr/bin/env python3
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
-from spotipy.exceptions import SpotifyException
+import time
+_STARTUP_T0 = time.perf_counter()
+
 import os
+import sys
+import threading
+from collections import deque
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from ascii_titles import show_title
-from dotenv import load_dotenv
-import time
-
-# ------------------ Load environment variables ------------------ #
-dotenv_path = Path(__file__).parent / "spotify_credentials.env"
-load_dotenv(dotenv_path)
+from ascii_titles import render_title
+from playlist_cache import PlaylistCache
+from records import Track, entries_from_page
+from queue_state import QueueState
+from prefetch import Prefetcher
+from command_queue import SKIPS, CommandQueue
+from scheduler import INTERACTIVE, REFRESH, PRIORITY_NAMES, Scheduler
+from search_cache import SearchCache
+from library_index import LibraryIndex
+from user_playlists import UserPlaylists
+from pagination import LazyPages, add_worker_context, fetch_all_pages
+from paged_view import PAGER_CHROME_LINES, PagedView
+from playback_state import PlaybackState, wait_for_playback_change
+from metrics import BUCKETS, Metrics, TimedConsole
 
 # ------------------ Spotify setup ------------------ #
-CLIENT_ID = os.getenv("CLIENT_ID")
-CLIENT_SECRET = os.getenv("CLIENT_SECRET")
 REDIRECT_URI = "http://127.0.0.1:8888/callback"
 SCOPE = (
     "user-read-playback-state "
@@ -27,28 +34,169 @@ SCOPE = (
     "playlist-modify-private"
 )
 CACHE_PATH = os.path.join(os.path.expanduser("~/spotify_controller"), ".cache")
+PLAYLIST_CACHE_PATH = os.path.join(os.path.expanduser("~/spotify_controller"), "playlists.db")
+PAGE_WORKERS = int(os.getenv("SPOTUIFY_PAGE_WORKERS", "4"))
+SEARCH_CACHE_PATH = os.path.join(os.path.expanduser("~/spotify_controller"), "search_cache.json")
+SEARCH_CACHE_TTL = float(os.getenv("SPOTUIFY_SEARCH_TTL", "600"))
+SEARCH_CACHE_PERSIST = os.getenv("SPOTUIFY_SEARCH_PERSIST", "1") != "0"
+PLAYBACK_WAIT_TIMEOUT = float(os.getenv("SPOTUIFY_PLAYBACK_WAIT", "2.0"))
+# Progress is extrapolated between polls, so this is only a drift check.
+PLAYBACK_REFRESH_INTERVAL = float(os.getenv("SPOTUIFY_PLAYBACK_REFRESH", "30.0"))
+# Seconds after which pause/shuffle/repeat re-fetch the state before toggling (0: never).
+TOGGLE_MAX_AGE = float(os.getenv("SPOTUIFY_TOGGLE_MAX_AGE", "0"))
+USE_ASYNC_CLIENT = os.getenv("SPOTUIFY_ASYNC", "0") == "1"
+HTTP_POOL_SIZE = int(os.getenv("SPOTUIFY_POOL_SIZE", "10"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("SPOTUIFY_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("SPOTUIFY_READ_TIMEOUT", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("SPOTUIFY_MAX_RETRIES", "3"))
+HTTP_BACKOFF = float(os.getenv("SPOTUIFY_BACKOFF", "0.3"))
+DASHBOARD_FPS = float(os.getenv("SPOTUIFY_DASHBOARD_FPS", "4"))
+LIBRARY_PREFIX = "lib:"
+VIEW_ROWS = int(os.getenv("SPOTUIFY_VIEW_ROWS", "0"))
+QUEUE_SIZE = int(os.getenv("SPOTUIFY_QUEUE_SIZE", "50"))
+PREFETCH_ENABLED = os.getenv("SPOTUIFY_PREFETCH", "1") != "0"
+PREFETCH_DELAY = float(os.getenv("SPOTUIFY_PREFETCH_DELAY", "0.5"))
+PREFETCH_PLAYLISTS = int(os.getenv("SPOTUIFY_PREFETCH_PLAYLISTS", "3"))
+COALESCE_WINDOW = float(os.getenv("SPOTUIFY_COALESCE_WINDOW", "0.4"))
+# Spotify rate-limits per app over a rolling 30 s window; 5/s sustained stays well inside it.
+RATE_LIMIT = float(os.getenv("SPOTUIFY_RATE_LIMIT", "5"))
+RATE_BURST = int(os.getenv("SPOTUIFY_RATE_BURST", "30"))
+TOKEN_REFRESH_MARGIN = float(os.getenv("SPOTUIFY_TOKEN_REFRESH_MARGIN", "300"))
+# Client methods that only read, so identical concurrent calls can share one request.
+READ_METHODS = frozenset({
+    "current_playback", "current_user", "current_user_playlists", "me", "playlist",
+    "playlist_items", "queue", "search", "track", "tracks",
+})
+
+local_queue = QueueState(max_size=QUEUE_SIZE)
+console = TimedConsole()
+metrics = Metrics()
+scheduler = Scheduler(
+    rate=RATE_LIMIT,
+    burst=RATE_BURST,
+    is_read=READ_METHODS.__contains__,
+    thread_priorities={"playback-refresher": REFRESH, "command-queue": INTERACTIVE},
+)
+# Page workers fetch at the priority of the thread that handed them the pages.
+add_worker_context(scheduler.carry)
+playlist_cache = PlaylistCache(PLAYLIST_CACHE_PATH)
+search_cache = SearchCache(
+    ttl=SEARCH_CACHE_TTL,
+    path=SEARCH_CACHE_PATH if SEARCH_CACHE_PERSIST else None,
+    encode=lambda tracks: [t.to_row() for t in tracks],
+    decode=lambda rows: [Track.from_row(row) for row in rows],
+)
+library_index = LibraryIndex(loader=playlist_cache.iter_playlists)
+recent_playlists = deque(reversed(playlist_cache.recent(PREFETCH_PLAYLISTS)), maxlen=PREFETCH_PLAYLISTS)
+prefetched_pages = {}
 
-local_queue = []
-console = Console()
-
-if not CLIENT_ID or not CLIENT_SECRET:
-    console.print("[red]Error: CLIENT_ID or CLIENT_SECRET not found in spotify_credentials.env[/red]")
-    exit(1)
-
-try:
-    sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-        client_id=CLIENT_ID,
-        client_secret=CLIENT_SECRET,
-        redirect_uri=REDIRECT_URI,
-        scope=SCOPE,
-        cache_path=CACHE_PATH
-    ))
-except SpotifyException as e:
-    console.print(f"[red]Spotify authentication failed: {e}[/red]")
-    exit(1)
-except Exception as e:
-    console.print(f"[red]Unexpected error during Spotify setup: {e}[/red]")
-    exit(1)
+def create_spotify_client():
+    """
+    Load credentials, then build the HTTP session, OAuth manager and Spotify client.
+
+    spotipy, requests and dotenv are imported here rather than at module level,
+    so the prompt appears before any of them are loaded. Exits on missing
+    credentials or setup errors.
+
+    Returns:
+        spotipy.Spotify or SyncSpotify: Authenticated Spotify client.
+    """
+    from dotenv import load_dotenv
+    load_dotenv(Path(__file__).parent / "spotify_credentials.env")
+    client_id = os.getenv("CLIENT_ID")
+    client_secret = os.getenv("CLIENT_SECRET")
+
+    if not client_id or not client_secret:
+        console.print("[red]Error: CLIENT_ID or CLIENT_SECRET not found in spotify_credentials.env[/red]")
+        exit(1)
+
+    import spotipy
+    from spotipy.oauth2 import SpotifyOAuth
+    from spotipy.exceptions import SpotifyException
+    from transport import add_listener, build_session
+    from token_store import TokenRefresher, TokenStore
+
+    add_listener(metrics.on_transport_event)
+    add_listener(scheduler.on_transport_event)
+    try:
+        http_session = build_session(pool_size=HTTP_POOL_SIZE, max_retries=HTTP_MAX_RETRIES, backoff_factor=HTTP_BACKOFF)
+        token_store = TokenStore(CACHE_PATH)
+        auth_manager = SpotifyOAuth(
+            client_id=client_id,
+            client_secret=client_secret,
+            redirect_uri=REDIRECT_URI,
+            scope=SCOPE,
+            cache_handler=token_store,
+            requests_session=http_session,
+            requests_timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        )
+        # Refreshes the token ahead of expiry so no command waits for it.
+        TokenRefresher(auth_manager, token_store, margin=TOKEN_REFRESH_MARGIN).start()
+        if USE_ASYNC_CLIENT:
+            from async_client import AsyncSpotify, SyncSpotify
+            client = SyncSpotify(AsyncSpotify(
+                lambda: auth_manager.get_access_token(as_dict=False),
+                timeout=HTTP_READ_TIMEOUT,
+                max_connections=HTTP_POOL_SIZE,
+                max_retries=HTTP_MAX_RETRIES,
+                backoff_factor=HTTP_BACKOFF
+            ))
+        else:
+            client = spotipy.Spotify(
+                auth_manager=auth_manager,
+                requests_session=http_session,
+                requests_timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+            )
+    except SpotifyException as e:
+        console.print(f"[red]Spotify authentication failed: {e}[/red]")
+        exit(1)
+    except Exception as e:
+        console.print(f"[red]Unexpected error during Spotify setup: {e}[/red]")
+        exit(1)
+
+    return client
+
+class LazySpotify:
+    """
+    Stand-in for the Spotify client that builds the real one on first attribute access.
+
+    If wrap is given, every Web API method fetched from the client is passed
+    through wrap(name, method), e.g. to time each API call. Private methods and
+    those the client lists in LOCAL_METHODS are returned unwrapped.
+    """
+
+    def __init__(self, factory, wrap=None):
+        self._factory = factory
+        self._wrap = wrap
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """Whether the real client has been created yet."""
+        return self._client is not None
+
+    def __getattr__(self, name):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+        attr = getattr(self._client, name)
+        local = name.startswith("_") or name in getattr(type(self._client), "LOCAL_METHODS", ())
+        if self._wrap and callable(attr) and not local:
+            return self._wrap(name, attr)
+        return attr
+
+def wrap_client_method(name: str, method):
+    """Time a client method and route its calls through the request scheduler."""
+    return scheduler.wrap(name, metrics.timed_call(name, method))
+
+sp = LazySpotify(create_spotify_client, wrap=wrap_client_method)
+playback_state = PlaybackState(lambda: sp.current_playback(), interval=PLAYBACK_REFRESH_INTERVAL)
+user_playlists = UserPlaylists(
+    lambda offset, limit: sp.current_user_playlists(limit=limit, offset=offset),
+    workers=PAGE_WORKERS,
+)
 
 # ------------------ Help text ------------------ #
 HELP_TEXT = {
@@ -56,18 +204,21 @@ HELP_TEXT = {
     "prev, p": "Go to previous track",
     "pause": "Pause or resume playback",
     "show, s": "Show currently playing track",
+    "live, lv": "Live now-playing view with a progress bar (Ctrl+C to return)",
     "volume, v": "Set playback volume (0-100)",
     "track, t": "Search and play a track",
     "shuffle, sh": "Toggle shuffle on/off",
     "repeat, re": "Cycle repeat mode (off/context/track)",
-    "queue, qu": "Show local queue",
+    "queue, qu": "Show the upcoming queue",
     "add, a": "Search and add a track to queue",
     "showlists, sls": "List user playlists",
     "showlist, sl": "List tracks from a selected playlist",
     "playlist, pl": "Play a selected playlist",
     "createlist, cl": "Create a new playlist",
-    "addtolist, atl": "Add a track to a playlist",
-    "removefromlist, rfl": "Remove a track from a playlist",
+    "addtolist, atl": "Add tracks to a playlist (select several, e.g. 0-2,4)",
+    "removefromlist, rfl": "Remove tracks from a playlist (select several, e.g. 1-20,35,40)",
+    "synclib, sy": "Index all playlist tracks for offline search (prefix a search with lib:)",
+    "stats": "Show per-command timing and API statistics",
     "help, h": "Show this help message",
     "quit, q": "Exit the controller"
 }
@@ -82,33 +233,102 @@ def safe_call(func, success_msg=None):
         success_msg (str, optional): Message to display on successful execution.
 
     Returns:
-        None
+        bool: True if the function ran without raising.
     """
+    from spotipy.exceptions import SpotifyException
+
     try:
         func()
         if success_msg:
             console.print(f"[green]{success_msg}[/green]")
+        return True
     except SpotifyException as e:
         reason = e.msg or str(e)
         console.print(f"[red][!] Spotify command failed: {reason}[/red]")
     except Exception as e:
         console.print(f"[red][!] Unexpected error: {e}[/red]")
+    return False
 
-def get_current_track():
+def parse_selection(text: str, count: int):
+    """
+    Parse a multi-index selection such as "1-20,35,40".
+
+    Parameters:
+        text (str): Comma-separated indices and inclusive ranges.
+        count (int): Number of selectable items; valid indices are 0..count-1.
+
+    Returns:
+        list: Selected indices, sorted and without duplicates.
+
+    Raises:
+        ValueError: If the selection is empty, malformed or out of range.
+    """
+    selected = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        start, sep, end = part.partition("-")
+        first, last = int(start), int(end) if sep else int(start)
+        if first > last:
+            first, last = last, first
+        if first < 0 or last >= count:
+            raise ValueError(f"Index {part} out of range")
+        selected.update(range(first, last + 1))
+    if not selected:
+        raise ValueError("No tracks selected")
+    return sorted(selected)
+
+def search_tracks(query: str, limit: int = 5):
+    """
+    Search Spotify for tracks, answering repeated queries from the search cache.
+
+    Queries starting with LIBRARY_PREFIX are answered from the local library
+    index instead and never touch the network.
+
+    Parameters:
+        query (str): Search query.
+        limit (int): Maximum number of results.
+
+    Returns:
+        list: Matching Track records.
+    """
+    if query.lower().startswith(LIBRARY_PREFIX):
+        return library_index.search(query[len(LIBRARY_PREFIX):], limit)
+
+    results = search_cache.get(query, "track", limit)
+    if results is None:
+        items = sp.search(q=query, type="track", limit=limit)["tracks"]["items"]
+        results = [Track.from_api(t) for t in items]
+        search_cache.put(query, results, "track", limit)
+    return results
+
+def print_search_cache_stats():
+    """Print the search cache hit/miss counters."""
+    console.print(f"[dim]Search cache: {search_cache.hits} hits / {search_cache.misses} misses[/dim]")
+
+def get_current_track(playback=None):
     """
     Retrieve the currently playing track info.
 
+    Parameters:
+        playback (dict, optional): Playback state to use instead of the shared
+            one, whose progress is extrapolated to now.
+
     Returns:
         dict or None: Dictionary containing:
             - 'title': Track title (str)
             - 'artists': Comma-separated list of artist names (str)
             - 'album': Album name (str)
             - 'progress': Current playback time / total duration (str)
+            - 'progress_ms': Current playback time (int)
+            - 'duration_ms': Track duration (int)
             - 'is_playing': Boolean indicating if track is playing
         Returns None if no track is playing or on error.
     """
     try:
-        playback = sp.current_playback()
+        if playback is None:
+            playback_state.get()
+            playback = playback_state.live()
         if not playback or not playback.get("item"):
             return None
         item = playback["item"]
@@ -117,39 +337,106 @@ def get_current_track():
             "artists": ", ".join(a["name"] for a in item.get("artists", [])),
             "album": item.get("album", {}).get("name"),
             "progress": f"{playback.get('progress_ms',0)//60000}:{(playback.get('progress_ms',0)//1000)%60:02d} / {item.get('duration_ms',0)//60000}:{(item.get('duration_ms',0)//1000)%60:02d}",
+            "progress_ms": playback.get("progress_ms", 0),
+            "duration_ms": item.get("duration_ms", 0),
             "is_playing": playback.get("is_playing", False)
         }
     except Exception:
         return None
 
-def current_track():
+def current_track(playback=None):
     """
     Display detailed information about the currently playing track in a rich Panel.
 
+    Parameters:
+        playback (dict, optional): Playback state to display instead of fetching it.
+
     Returns:
         None
     """
-    track = get_current_track()
+    console.print(now_playing_panel(get_current_track(playback)))
+
+def now_playing_panel(track):
+    """
+    Build the Now Playing panel for a track.
+
+    Parameters:
+        track (dict or None): Track info as returned by get_current_track.
+
+    Returns:
+        Panel: The Now Playing panel.
+    """
     if track:
         status = "▶ Playing" if track["is_playing"] else "⏸ Paused"
-        console.print(Panel(f"[bold]{track['title']}[/bold] — {track['artists']}\nAlbum: {track['album']}\nProgress: {track['progress']}\nStatus: {status}", title="Now Playing"))
-    else:
-        console.print(Panel("[yellow]No track currently playing[/yellow]", title="Now Playing"))
+        return Panel(f"[bold]{track['title']}[/bold] — {track['artists']}\nAlbum: {track['album']}\nProgress: {track['progress']}\n{progress_bar(track)}\nStatus: {status}", title="Now Playing")
+    return Panel("[yellow]No track currently playing[/yellow]", title="Now Playing")
 
-def print_title(console):
+def progress_bar(track, width: int = 40) -> str:
+    """Render a track's progress as a bar of `width` characters in rich markup."""
+    duration = track.get("duration_ms") or 0
+    filled = min(width, width * track.get("progress_ms", 0) // duration) if duration else 0
+    return f"[green]{'━' * filled}[/green][dim]{'─' * (width - filled)}[/dim]"
+
+def snapshot_playback():
     """
-    Display the ASCII title/logo if console dimensions are sufficient.
+    Get the playback state to compare against after a playback command.
+
+    Uses the shared playback state if it was refreshed within the last second,
+    so the snapshot does not predate a track change that happened on its own.
+
+    Returns:
+        dict or None: Current playback state, or None if unavailable.
+    """
+    return playback_state.get(max_age=1.0)
+
+def toggle_base(kind: str = None):
+    """
+    Get the playback state a toggle (pause, shuffle, repeat) flips.
+
+    By default this is the stored state, so a toggle costs one request; the
+    change is applied optimistically and the confirming refresh corrects it
+    if another device had changed the setting in the meantime. With
+    TOGGLE_MAX_AGE set, a state older than that is fetched first, trading an
+    extra request per toggle for never flipping a stale value. While a change
+    of the same kind is still queued, the stored state already includes it.
 
     Parameters:
-        console (Console): Rich Console instance for printing.
+        kind (str, optional): Queued setting the toggle changes, e.g. "shuffle".
+
+    Returns:
+        dict or None: Playback state, or None if nothing is playing.
+    """
+    if TOGGLE_MAX_AGE <= 0 or (kind and command_queue.pending(kind) is not None):
+        return playback_state.get()
+    return playback_state.get(max_age=TOGGLE_MAX_AGE)
+
+def show_after_change(before):
+    """
+    Wait until playback differs from a pre-command snapshot, then display it.
+
+    Parameters:
+        before (dict or None): Playback state from before the command.
 
     Returns:
         None
     """
+    start = time.perf_counter()
+    playback = wait_for_playback_change(playback_state.refresh, before, timeout=PLAYBACK_WAIT_TIMEOUT)
+    metrics.add_wait(time.perf_counter() - start)
+    current_track(playback)
+
+def title_renderable(width: int, height: int):
+    """
+    Pick the ASCII title/logo that fits the given terminal size.
+
+    Parameters:
+        width (int): Terminal width.
+        height (int): Terminal height.
+
+    Returns:
+        Segments or None: The rendered title, or None if the terminal is too small.
+    """
     TITLE_FILE = Path(__file__).parent / "logos.txt"
-    
-    width = console.size.width
-    height = console.size.height
 
     index = 5
     indent = 2
@@ -160,28 +447,163 @@ def print_title(console):
             index = 2
             indent = 3
 
-        show_title(TITLE_FILE, index=index, color="bold green", border_color="cyan", indent=indent)
+        return render_title(TITLE_FILE, index=index, color="bold green", border_color="cyan", indent=indent, width=width)
+    return None
+
+def print_title(console):
+    """
+    Display the ASCII title/logo if console dimensions are sufficient.
+
+    Parameters:
+        console (Console): Rich Console instance for printing.
+
+    Returns:
+        None
+    """
+    title = title_renderable(console.size.width, console.size.height)
+    if title is not None:
+        console.print(title)
+
+# ------------------ Command coalescing ------------------ #
+def send_queued(op):
+    """Send one merged playback mutation from the command queue."""
+    if op.kind == "next":
+        for _ in range(op.value):
+            sp.next_track()
+    elif op.kind == "prev":
+        for _ in range(op.value):
+            sp.previous_track()
+    elif op.kind == "volume":
+        sp.volume(op.value)
+    elif op.kind == "shuffle":
+        sp.shuffle(op.value)
+    elif op.kind == "repeat":
+        sp.repeat(op.value)
+
+command_queue = CommandQueue(send_queued, window=COALESCE_WINDOW, on_flushed=playback_state.update)
+
+def predict_skip(skips: int):
+    """
+    Guess the playback state after skipping forward, from the last reconciled queue.
+
+    Parameters:
+        skips (int): Skips pending in the current burst, including the one just queued.
+
+    Returns:
+        dict or None: Playback fields to apply, or None if the queue doesn't tell.
+    """
+    playback = playback_state.peek() or {}
+    shown = (playback.get("item") or {}).get("uri")
+    anchor = local_queue.current if skips == 1 else (local_queue.upcoming[skips - 2] if skips - 2 < len(local_queue.upcoming) else None)
+    if anchor is None or anchor.uri != shown or skips > len(local_queue.upcoming):
+        return None
+    track = local_queue.upcoming[skips - 1]
+    return {
+        "item": {
+            "id": track.id,
+            "uri": track.uri,
+            "name": track.name,
+            "artists": [{"name": name} for name in track.artists],
+            "album": {"name": track.album},
+            "duration_ms": track.duration_ms,
+        },
+        "progress_ms": 0,
+    }
+
+def queue_playback_change(kind: str, value=None):
+    """
+    Queue a skip or a playback setting and apply it optimistically to the playback state.
+
+    Parameters:
+        kind (str): "next", "prev", "volume", "shuffle" or "repeat".
+        value: New volume, shuffle state or repeat state.
+
+    Returns:
+        list: (PendingOp, exception) pairs for failures; only non-empty when the
+        queue has no coalescing window and sent the change right away.
+    """
+    playback = playback_state.peek() or {}
+    if kind in SKIPS:
+        errors = command_queue.submit(kind)
+        if kind == "next" and not errors and command_queue.window > 0:
+            predicted = predict_skip(command_queue.pending("next"))
+            if predicted:
+                playback_state.update(confirm=False, **predicted)
+        return errors
+
+    if kind == "volume":
+        device = playback.get("device") or {}
+        original, changes = device.get("volume_percent"), {"device": {**device, "volume_percent": value}}
+    else:
+        original, changes = playback.get(f"{kind}_state"), {f"{kind}_state": value}
+    errors = command_queue.submit(kind, value, original)
+    if not errors:
+        playback_state.update(confirm=command_queue.window <= 0, **changes)
+    return errors
+
+def report_queue_errors(errors=()) -> bool:
+    """
+    Print failed queued commands, including ones sent in the background since the last command.
+
+    Returns:
+        bool: True if any of the given errors were printed.
+    """
+    for op, e in list(errors) + command_queue.take_errors():
+        console.print(f"[red][!] Spotify command failed ({op.kind}): {getattr(e, 'msg', None) or e}[/red]")
+    return bool(errors)
+
+def show_queued_skip(kind: str):
+    """
+    Queue a skip into the current burst without waiting for it to be sent.
+
+    The expected track is shown when predict_skip could tell it from the
+    loaded queue. Otherwise the stored state still holds the track being
+    skipped, so the skip is only reported as pending.
+    """
+    shown = ((playback_state.peek() or {}).get("item") or {}).get("uri")
+    if report_queue_errors(queue_playback_change(kind)):
+        return
+    skips = max(1, command_queue.pending(kind))
+    direction = "forward" if kind == "next" else "back"
+    console.print(f"[green]Skipping {skips} track{'s' if skips > 1 else ''} {direction}.[/green]")
+    playback = playback_state.live()
+    if shown and ((playback or {}).get("item") or {}).get("uri") != shown:
+        current_track(playback)
+    else:
+        console.print("[dim]The new track is known once the skip has been sent; run 'show' to see it.[/dim]")
 
 # ------------------ Command wrappers ------------------ #
 def cmd_next():
     """Skip to the next track and display the currently playing track."""
-    safe_call(lambda: sp.next_track(), "Skipped to next track.")
-    time.sleep(0.5)
-    current_track()
+    if command_queue.window > 0:
+        show_queued_skip("next")
+        return
+    before = snapshot_playback()
+    if safe_call(lambda: sp.next_track(), "Skipped to next track."):
+        show_after_change(before)
+    else:
+        current_track()
 
 def cmd_prev():
     """Go back to the previous track and display the currently playing track."""
-    safe_call(lambda: sp.previous_track(), "Went back to previous track.")
-    time.sleep(0.5)
-    current_track()
+    if command_queue.window > 0:
+        show_queued_skip("prev")
+        return
+    before = snapshot_playback()
+    if safe_call(lambda: sp.previous_track(), "Went back to previous track."):
+        show_after_change(before)
+    else:
+        current_track()
 
 def cmd_pause_resume():
     """Pause playback if playing, or resume playback if paused."""
-    playback = sp.current_playback()
+    playback = toggle_base()
     if playback and playback.get("is_playing"):
-        safe_call(lambda: sp.pause_playback(), "Playback paused")
+        if safe_call(lambda: sp.pause_playback(), "Playback paused"):
+            playback_state.update(is_playing=False)
     else:
-        safe_call(lambda: sp.start_playback(), "Playback resumed")
+        if safe_call(lambda: sp.start_playback(), "Playback resumed"):
+            playback_state.update(is_playing=True)
     current_track()
 
 def cmd_volume():
@@ -189,51 +611,96 @@ def cmd_volume():
     vol = console.input("Set volume (0-100): ")
     try:
         vol = max(0, min(100, int(vol)))
-        safe_call(lambda: sp.volume(vol), f"Volume set to {vol}%")
+        playback_state.get()  # Make sure the current volume is known, so a no-op change is dropped.
+        if not report_queue_errors(queue_playback_change("volume", vol)):
+            console.print(f"[green]Volume set to {vol}%[/green]")
         console.print(f"\nVolume is now: [cyan]{vol}%[/cyan]")
     except ValueError:
         console.print("[red]Invalid input. Must be 0-100[/red]")
 
 def cmd_shuffle():
     """Toggle shuffle mode on the current playback."""
-    playback = sp.current_playback()
+    playback = toggle_base("shuffle")
     if playback:
         current = playback["shuffle_state"]
         new_state = not current
-        safe_call(lambda: sp.shuffle(new_state), f"Shuffle set to {new_state}")
+        if not report_queue_errors(queue_playback_change("shuffle", new_state)):
+            console.print(f"[green]Shuffle set to {new_state}[/green]")
         console.print(f"\nCurrent shuffle state: [cyan]{new_state}[/cyan]")
     else:
         console.print("[red]No active playback found[/red]")
 
 def cmd_repeat():
     """Cycle the repeat mode through 'off', 'context', and 'track'."""
-    playback = sp.current_playback()
+    playback = toggle_base("repeat")
     if playback:
         states = ["off", "context", "track"]
         current = playback["repeat_state"]
         next_state = states[(states.index(current) + 1) % 3]
-        safe_call(lambda: sp.repeat(next_state), f"Repeat set to {next_state}")
+        if not report_queue_errors(queue_playback_change("repeat", next_state)):
+            console.print(f"[green]Repeat set to {next_state}[/green]")
         console.print(f"\nCurrent repeat state: [cyan]{next_state}[/cyan]")
     else:
         console.print("[red]No active playback found[/red]")
 
+def cmd_live():
+    """
+    Show a now-playing panel that updates every second until Ctrl+C.
+
+    Progress is extrapolated locally between polls, so the view itself makes
+    no requests; the refresher fetches the state when the track should end
+    and at the drift-check interval.
+    """
+    from rich.live import Live
+
+    playback_state.get()
+    if sp.loaded:
+        playback_state.start()
+    console.print("[dim]Ctrl+C to return[/dim]")
+    try:
+        with Live(now_playing_panel(get_current_track(playback_state.live())), console=console, refresh_per_second=1) as live:
+            while True:
+                time.sleep(1.0 - time.monotonic() % 1.0)
+                live.update(now_playing_panel(get_current_track(playback_state.live())))
+    except KeyboardInterrupt:
+        pass
+
 def cmd_show_queue():
-    """Display the local queue of tracks added by the user."""
-    if not local_queue:
-        console.print("[yellow]Local queue is empty[/yellow]")
+    """
+    Display the upcoming queue, marking the tracks added from this controller.
+
+    The queue is reconciled with Spotify in a single request; locally queued
+    tracks that have since played are dropped.
+    """
+    try:
+        local_queue.reconcile(sp.queue())
+    except Exception as e:
+        console.print(f"[red][!] Could not refresh the queue: {e}[/red]")
+
+    if not local_queue.upcoming:
+        if local_queue.added:
+            console.print("[yellow]Spotify's queue is unavailable; showing tracks added here[/yellow]")
+            upcoming, marks = list(local_queue.added), set(range(len(local_queue.added)))
+        else:
+            console.print("[yellow]Queue is empty[/yellow]")
+            current_track()
+            return
     else:
-        table = Table(title="Local Queue")
-        table.add_column("Index", style="bold green")
-        table.add_column("Title", style="yellow")
-        table.add_column("Artists", style="cyan")
-        for i, t in enumerate(local_queue):
-            table.add_row(str(i+1), t['name'], t['artists'][0]['name'])
-        console.print(table)
+        upcoming, marks = local_queue.upcoming, local_queue.added_here()
+
+    table = Table(title="Up Next")
+    table.add_column("Index", style="bold green")
+    table.add_column("Title", style="yellow")
+    table.add_column("Artists", style="cyan")
+    table.add_column("Added here", style="green")
+    for i, t in enumerate(upcoming):
+        table.add_row(str(i+1), t.name, t.artist_names, "✓" if i in marks else "")
+    console.print(table)
     current_track()
 
 def cmd_add_track():
     """
-    Search for a track by name, add it to Spotify queue, and append it to local_queue.
+    Search for a track by name, add it to Spotify queue, and record it in local_queue.
     
     Prompts the user to select a track from search results.
     """
@@ -243,7 +710,7 @@ def cmd_add_track():
             console.print("[red]Track name cannot be empty[/red]")
             return
 
-        results = sp.search(q=query, type="track", limit=5)["tracks"]["items"]
+        results = search_tracks(query)
         if not results:
             console.print("[yellow]No tracks found[/yellow]")
             return
@@ -253,16 +720,16 @@ def cmd_add_track():
         table.add_column("Title", style="yellow")
         table.add_column("Artists", style="cyan")
         for i, t in enumerate(results):
-            artists = ", ".join(a.get("name", "Unknown") for a in t.get("artists", []))
-            table.add_row(str(i), t.get("name", "Unknown"), artists)
+            table.add_row(str(i), t.name, t.artist_names)
         console.print(table)
+        print_search_cache_stats()
 
         idx = int(console.input("Select track index: "))
         if not (0 <= idx < len(results)):
             raise ValueError("Track index out of range")
         track = results[idx]
-        safe_call(lambda: sp.add_to_queue(track["uri"]), f"Added {track.get('name', 'Unknown')} to queue")
-        local_queue.append(track)
+        if safe_call(lambda: sp.add_to_queue(track.uri), f"Added {track.name} to queue"):
+            local_queue.add(track)
 
     except Exception as e:
         console.print(f"[red]Something went wrong: {e}[/red]")
@@ -271,9 +738,11 @@ def cmd_play_track_and_show_current():
     """
     Prompt user to play a track by name and then display the currently playing track.
     """
-    cmd_play_track()
-    time.sleep(0.5)
-    current_track()
+    before = snapshot_playback()
+    if cmd_play_track():
+        show_after_change(before)
+    else:
+        current_track()
 
 def cmd_play_track():
     """
@@ -281,6 +750,9 @@ def cmd_play_track():
 
     Prompts the user to enter a track name, displays search results,
     and allows the user to select which track to play.
+
+    Returns:
+        bool: True if playback of the selected track was started.
     """
     try:
         query = console.input("Track name to play: ").strip()
@@ -288,7 +760,7 @@ def cmd_play_track():
             console.print("[red]Track name cannot be empty[/red]")
             return
 
-        results = sp.search(q=query, type="track", limit=5)["tracks"]["items"]
+        results = search_tracks(query)
         if not results:
             console.print("[yellow]No tracks found[/yellow]")
             return
@@ -298,9 +770,9 @@ def cmd_play_track():
         table.add_column("Title", style="yellow")
         table.add_column("Artists", style="cyan")
         for i, t in enumerate(results):
-            artists = ", ".join(a.get("name", "Unknown") for a in t.get("artists", []))
-            table.add_row(str(i), t.get("name", "Unknown"), artists)
+            table.add_row(str(i), t.name, t.artist_names)
         console.print(table)
+        print_search_cache_stats()
 
         idx_input = console.input("Select track index: ").strip()
         idx = int(idx_input)
@@ -308,78 +780,296 @@ def cmd_play_track():
             raise ValueError("Track index out of range")
 
         track = results[idx]
-        safe_call(lambda: sp.start_playback(uris=[track["uri"]]), f"Playing {track.get('name', 'Unknown')}")
+        return safe_call(lambda: sp.start_playback(uris=[track.uri]), f"Playing {track.name}")
 
     except Exception as e:
         console.print(f"[red]Something went wrong: {e}[/red]")
+    return False
 
-def show_playlist_tracks(playlist_id: str):
+def playlist_add_bulk(playlist_id: str, uris: list):
     """
-    Display all tracks in a given playlist.
+    Append tracks to a playlist, up to 100 per request.
+
+    Parameters:
+        playlist_id (str): The Spotify playlist ID.
+        uris (list): Track URIs to add, in order.
+
+    Returns:
+        int: Number of requests made.
+    """
+    from batch import chunks
+
+    requests_made = 0
+    for chunk in chunks(uris):
+        result = sp.playlist_add_items(playlist_id, chunk)
+        user_playlists.note_change(playlist_id, (result or {}).get("snapshot_id"), delta=len(chunk))
+        requests_made += 1
+    return requests_made
+
+def playlist_remove_positions(playlist_id: str, snapshot_id: str, tracks: list, positions: list):
+    """
+    Remove the items at the given positions from a playlist, up to 100 per request.
+
+    Positions refer to the snapshot the items were listed from. Chunks are
+    sent from the end of the playlist backwards, each against the snapshot
+    returned by the previous one, so earlier positions never shift. The
+    remaining items are stored in the cache under the final snapshot, so the
+    playlist doesn't have to be downloaded again.
+
+    Parameters:
+        playlist_id (str): The Spotify playlist ID.
+        snapshot_id (str): Snapshot the positions refer to.
+        tracks (list): The playlist's PlaylistEntry records in that snapshot.
+        positions (list): Indices into tracks to remove.
+
+    Returns:
+        int: Number of requests made.
+    """
+    from batch import chunks
+
+    requests_made = 0
+    for chunk in chunks(sorted(positions, reverse=True)):
+        by_uri = {}
+        for pos in chunk:
+            by_uri.setdefault(tracks[pos].track.uri, []).append(pos)
+        result = sp.playlist_remove_specific_occurrences_of_items(
+            playlist_id,
+            [{"uri": uri, "positions": sorted(p)} for uri, p in by_uri.items()],
+            snapshot_id=snapshot_id,
+        )
+        snapshot_id = (result or {}).get("snapshot_id")
+        user_playlists.note_change(playlist_id, snapshot_id, delta=-len(chunk))
+        requests_made += 1
+
+    if snapshot_id:
+        removed = set(positions)
+        remaining = [item for i, item in enumerate(tracks) if i not in removed]
+        remaining = playlist_cache.store(playlist_id, snapshot_id, remaining)
+        library_index.update_playlist(playlist_id, snapshot_id, remaining)
+    return requests_made
+
+def playlist_page_fetcher(playlist_id: str):
+    """
+    Return a fetch_page(offset, limit) for a playlist whose pages hold PlaylistEntry records.
+
+    Each page is parsed as soon as it arrives, so the full Spotify JSON of a
+    track is never kept beyond the request that returned it.
+    """
+    def fetch_page(offset, limit):
+        page = sp.playlist_items(playlist_id, offset=offset, limit=limit)
+        return {"items": entries_from_page(page, offset), "total": page.get("total")}
+    return fetch_page
+
+def note_recent_playlist(playlist_id: str):
+    """Move a playlist to the front of the recently used list that idle prefetching warms."""
+    if playlist_id in recent_playlists:
+        recent_playlists.remove(playlist_id)
+    recent_playlists.append(playlist_id)
+
+def fetch_playlist_tracks(playlist_id: str, snapshot_id: str = None, name: str = None):
+    """
+    Return all items of a playlist, served from the local cache when the snapshot is unchanged.
 
     Args:
         playlist_id (str): The Spotify playlist ID to retrieve tracks from.
+        snapshot_id (str, optional): The playlist's current snapshot_id, as listed by
+            current_user_playlists. Looked up with a single request when omitted.
+        name (str, optional): Playlist name, stored alongside the cached tracks.
+
+    Returns:
+        list: PlaylistEntry records in playlist order.
+    """
+    note_recent_playlist(playlist_id)
+    if not snapshot_id:
+        snapshot_id = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+
+    cached = playlist_cache.get(playlist_id, snapshot_id)
+    if cached is not None:
+        return cached
+
+    tracks = fetch_all_pages(
+        playlist_page_fetcher(playlist_id),
+        limit=100,
+        workers=PAGE_WORKERS,
+    )
+    tracks = playlist_cache.store(playlist_id, snapshot_id, tracks, name=name)
+    library_index.update_playlist(playlist_id, snapshot_id, tracks)
+    return tracks
+
+def playlist_items_source(playlist_id: str, snapshot_id: str = None, name: str = None):
     """
-    tracks = []
-    offset = 0
-    limit = 100
+    Get a playlist's items for display without downloading more than is shown.
 
-    while True:
-        response = sp.playlist_items(playlist_id, offset=offset, limit=limit)
-        items = response['items']
-        if not items:
-            break
-        tracks.extend(items)
-        offset += len(items)
-        if len(items) < limit:
-            break
-
-    if not tracks:
+    Args:
+        playlist_id (str): The Spotify playlist ID.
+        snapshot_id (str, optional): The playlist's current snapshot_id.
+        name (str, optional): Playlist name, stored alongside the cached tracks.
+
+    Returns:
+        CachedPlaylist or LazyPages: A windowed view of the cached items, or a LazyPages
+            that fetches pages as they are viewed and caches the playlist once every page is in.
+    """
+    note_recent_playlist(playlist_id)
+    if not snapshot_id:
+        snapshot_id = sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+
+    cached = playlist_cache.view(playlist_id, snapshot_id)
+    if cached is not None:
+        return cached
+
+    fetch_page = playlist_page_fetcher(playlist_id)
+
+    def complete(items):
+        stored = playlist_cache.store(playlist_id, snapshot_id, items, name=name)
+        library_index.update_playlist(playlist_id, snapshot_id, stored)
+
+    first = prefetched_pages.pop((playlist_id, snapshot_id), None) or fetch_page(0, 100)
+    items = first.get("items", [])
+    return LazyPages(fetch_page, first.get("total") or len(items), page_size=100, first_page=items,
+                     workers=PAGE_WORKERS, on_complete=complete)
+
+def finish_playlist_download(source):
+    """
+    Fetch the pages a viewer left out on a background thread.
+
+    A LazyPages only caches the playlist once every page is in, so without
+    this an unchanged playlist longer than one page would be fetched again
+    each time it is opened. The thread runs at bulk priority and is never
+    waited for.
+
+    Args:
+        source (list, CachedPlaylist or LazyPages): Source that was displayed.
+    """
+    if isinstance(source, LazyPages) and not source.complete:
+        threading.Thread(target=source.all, name="playlist-download", daemon=True).start()
+
+def playlist_view(source, title: str, first_index: int = 1):
+    """
+    Build a paged viewer over playlist items.
+
+    Args:
+        source (list, CachedPlaylist or LazyPages): PlaylistEntry records.
+        title (str): Table title.
+        first_index (int): Number shown for the first track.
+
+    Returns:
+        PagedView: Viewer sized to the terminal (or SPOTUIFY_VIEW_ROWS).
+    """
+    def row(index, entry):
+        return str(index + first_index), entry.track.name, entry.track.artist_names
+
+    def matches(entry, text):
+        track = entry.track
+        return text.casefold() in f"{track.name} {' '.join(track.artists)} {track.album or ''}".casefold()
+
+    if getattr(console, "is_region", False):
+        # The dashboard's output region only has to hold the page and the pager's own lines.
+        page_size = VIEW_ROWS or max(3, console.size.height - PAGER_CHROME_LINES)
+    else:
+        page_size = VIEW_ROWS or max(10, console.size.height - 14)
+    columns = [("Index", "green"), ("Title", "yellow"), ("Artists", "cyan")]
+    return PagedView(source, title, columns, row, matches, page_size=page_size)
+
+def show_playlist_tracks(playlist_id: str, snapshot_id: str = None, interactive: bool = True):
+    """
+    Display the tracks in a given playlist, one page at a time.
+
+    Only the visible page is rendered, and an uncached playlist is only
+    downloaded as far as it is viewed before the pager opens; the rest is
+    fetched in the background afterwards so the playlist gets cached.
+    Playlists longer than one page open in a pager with next/prev/jump/filter.
+
+    Args:
+        playlist_id (str): The Spotify playlist ID to retrieve tracks from.
+        snapshot_id (str, optional): The playlist's current snapshot_id.
+        interactive (bool): Open the pager; otherwise only show the first page.
+    """
+    source = playlist_items_source(playlist_id, snapshot_id)
+
+    if not len(source):
         console.print("[yellow]Playlist is empty[/yellow]")
         return
 
-    table = Table(title="Playlist Tracks")
-    table.add_column("Index", style="green")
-    table.add_column("Title", style="yellow")
-    table.add_column("Artists", style="cyan")
+    view = playlist_view(source, "Playlist Tracks")
+    if interactive and len(source) > view.page_size:
+        view.run(console)
+    else:
+        console.print(view.render())
+        if len(source) > view.page_size:
+            console.print(f"[dim]Showing {view.page_size} of {len(source)} tracks; use showlist to browse them all[/dim]")
+    finish_playlist_download(source)
 
-    for i, item in enumerate(tracks, 1):
-        track = item["track"]
-        title = track["name"]
-        artists = ", ".join(a["name"] for a in track["artists"])
-        table.add_row(str(i), title, artists)
+def print_playlists(title: str, show_totals: bool = True, refresh: bool = False):
+    """
+    Print the user's playlists, rendering each page of rows as soon as it arrives.
 
-    console.print(table)
+    Args:
+        title (str): Table title.
+        show_totals (bool): Whether to include each playlist's track count.
+        refresh (bool): Fetch the list again instead of using the session's copy.
+
+    Returns:
+        list: All playlists, in the order they were numbered.
+    """
+    pls = []
+    for page in user_playlists.stream(refresh=refresh):
+        if not page:
+            continue
+        # Fixed column widths keep the per-page tables aligned with each other.
+        table = Table(title=None if pls else title, show_header=not pls)
+        table.add_column("Index", style="green", width=5)
+        table.add_column("Name", style="yellow", width=40, no_wrap=True)
+        if show_totals:
+            table.add_column("Tracks", style="cyan", width=6)
+        for i, p in enumerate(page, len(pls)):
+            row = [str(i), p.get('name', 'Unknown')]
+            if show_totals:
+                row.append(str(p.get('tracks', {}).get('total', 0)))
+            table.add_row(*row)
+        console.print(table)
+        pls.extend(page)
+    return pls
+
+def select_playlist(title: str, show_totals: bool = True):
+    """
+    List the user's playlists and prompt for one by index.
+
+    Args:
+        title (str): Table title.
+        show_totals (bool): Whether to include each playlist's track count.
+
+    Returns:
+        dict or None: The selected playlist, or None if the user has none.
+
+    Raises:
+        ValueError: If the input is not a valid playlist index.
+    """
+    pls = print_playlists(title, show_totals)
+    if not pls:
+        console.print("[yellow]No playlists found[/yellow]")
+        return None
+
+    idx_input = console.input("Select playlist index: ").strip()
+    idx = int(idx_input)
+    if not (0 <= idx < len(pls)):
+        raise ValueError("Playlist index out of range")
+    return pls[idx]
 
 def cmd_show_playlist_tracks():
     """
     List user playlists, prompt to select one, and display its tracks.
     """
     try:
-        pls = sp.current_user_playlists()["items"]
-        if not pls:
-            console.print("[yellow]No playlists found[/yellow]")
+        playlist = select_playlist("User Playlists")
+        if playlist is None:
             return
 
-        table = Table(title="User Playlists")
-        table.add_column("Index", style="green")
-        table.add_column("Name", style="yellow")
-        table.add_column("Tracks", style="cyan")
-        for i, p in enumerate(pls):
-            table.add_row(str(i), p.get('name', 'Unknown'), str(p.get('tracks', {}).get('total', 0)))
-        console.print(table)
-
-        idx_input = console.input("Select playlist index: ").strip()
-        idx = int(idx_input)
-        if not (0 <= idx < len(pls)):
-            raise ValueError("Playlist index out of range")
-
-        playlist_id = pls[idx].get('id')
+        playlist_id = playlist.get('id')
         if not playlist_id:
             console.print("[red]Selected playlist has no ID[/red]")
             return
 
-        show_playlist_tracks(playlist_id)
+        show_playlist_tracks(playlist_id, playlist.get('snapshot_id'))
 
     except ValueError as ve:
         console.print(f"[red]Invalid input: {ve}[/red]")
@@ -391,20 +1081,8 @@ def cmd_list_playlists():
     Display all user playlists in a table with their total track count.
     """
     try:
-        pls = sp.current_user_playlists()["items"]
-        if not pls:
+        if not print_playlists("User Playlists", refresh=True):
             console.print("[yellow]No playlists found[/yellow]")
-            return
-
-        table = Table(title="User Playlists")
-        table.add_column("Index", style="green")
-        table.add_column("Name", style="yellow")
-        table.add_column("Tracks", style="cyan")
-        for i, p in enumerate(pls):
-            name = p.get('name', 'Unknown')
-            total_tracks = str(p.get('tracks', {}).get('total', 0))
-            table.add_row(str(i), name, total_tracks)
-        console.print(table)
 
     except Exception as e:
         console.print(f"[red]Something went wrong: {e}[/red]")
@@ -414,24 +1092,10 @@ def cmd_play_playlist():
     Prompt user to select a playlist to play and display its tracks.
     """
     try:
-        pls = sp.current_user_playlists()["items"]
-        if not pls:
-            console.print("[yellow]No playlists found[/yellow]")
+        playlist = select_playlist("User Playlists", show_totals=False)
+        if playlist is None:
             return
 
-        table = Table(title="User Playlists")
-        table.add_column("Index", style="green")
-        table.add_column("Name", style="yellow")
-        for i, p in enumerate(pls):
-            table.add_row(str(i), p.get('name', 'Unknown'))
-        console.print(table)
-
-        idx_input = console.input("Select playlist index: ").strip()
-        idx = int(idx_input)
-        if not (0 <= idx < len(pls)):
-            raise ValueError("Playlist index out of range")
-
-        playlist = pls[idx]
         playlist_uri = playlist.get('uri')
         playlist_id = playlist.get('id')
         playlist_name = playlist.get('name', 'Unknown')
@@ -440,10 +1104,13 @@ def cmd_play_playlist():
             console.print("[red]Selected playlist is invalid[/red]")
             return
 
-        safe_call(lambda: sp.start_playback(context_uri=playlist_uri), f"Playing {playlist_name}")
-        show_playlist_tracks(playlist_id)
-        time.sleep(0.5)
-        current_track()
+        before = snapshot_playback()
+        started = safe_call(lambda: sp.start_playback(context_uri=playlist_uri), f"Playing {playlist_name}")
+        show_playlist_tracks(playlist_id, playlist.get('snapshot_id'), interactive=False)
+        if started:
+            show_after_change(before)
+        else:
+            current_track()
 
     except ValueError as ve:
         console.print(f"[red]Invalid input: {ve}[/red]")
@@ -452,71 +1119,56 @@ def cmd_play_playlist():
 
 def cmd_add_to_playlist():
     """
-    Add a track to a selected playlist.
+    Add tracks to a selected playlist.
 
-    Prompts the user to select a playlist, search for a track,
-    and add the selected track to the chosen playlist.
+    Prompts the user to select a playlist, then to search for tracks and
+    select any number of results (e.g. "0-2,4") until a blank search, and
+    adds everything selected in bulk requests of up to 100 tracks.
     """
     try:
-        pls = sp.current_user_playlists()["items"]
-        if not pls:
-            console.print("[yellow]No playlists found[/yellow]")
+        playlist = select_playlist("Your Playlists", show_totals=False)
+        if playlist is None:
             return
 
-        table = Table(title="Your Playlists")
-        table.add_column("Index", style="green")
-        table.add_column("Name", style="yellow")
-        for i, p in enumerate(pls):
-            table.add_row(str(i), p.get("name", "Unknown"))
-        console.print(table)
-
-        idx_input = console.input("Select playlist index: ").strip()
-        idx = int(idx_input)
-        if not (0 <= idx < len(pls)):
-            raise ValueError("Playlist index out of range")
-
-        playlist = pls[idx]
         playlist_id = playlist.get("id")
         playlist_name = playlist.get("name", "Unknown")
         if not playlist_id:
             console.print("[red]Selected playlist is invalid[/red]")
             return
 
-        query = console.input("Track name to add: ").strip()
-        if not query:
-            console.print("[red]Track name cannot be empty[/red]")
-            return
-
-        results = sp.search(q=query, type="track", limit=5)["tracks"]["items"]
-        if not results:
-            console.print("[yellow]No tracks found[/yellow]")
-            return
-
-        table = Table(title="Search Results")
-        table.add_column("Index", style="green")
-        table.add_column("Title", style="yellow")
-        table.add_column("Artists", style="cyan")
-        for i, t in enumerate(results):
-            artists = ", ".join(a.get("name", "Unknown") for a in t.get("artists", []))
-            table.add_row(str(i), t.get("name", "Unknown"), artists)
-        console.print(table)
-
-        t_idx_input = console.input("Select track index to add: ").strip()
-        t_idx = int(t_idx_input)
-        if not (0 <= t_idx < len(results)):
-            raise ValueError("Track index out of range")
-
-        track = results[t_idx]
-        track_uri = track.get("uri")
-        track_name = track.get("name", "Unknown")
-
-        if not track_uri:
-            console.print("[red]Selected track is invalid[/red]")
-            return
-
+        selected = []
+        while True:
+            prompt = "Track name to add (blank to finish): " if selected else "Track name to add: "
+            query = console.input(prompt).strip()
+            if not query:
+                if selected:
+                    break
+                console.print("[red]Track name cannot be empty[/red]")
+                return
+
+            results = search_tracks(query)
+            if not results:
+                console.print("[yellow]No tracks found[/yellow]")
+                continue
+
+            table = Table(title="Search Results")
+            table.add_column("Index", style="green")
+            table.add_column("Title", style="yellow")
+            table.add_column("Artists", style="cyan")
+            for i, t in enumerate(results):
+                table.add_row(str(i), t.name, t.artist_names)
+            console.print(table)
+            print_search_cache_stats()
+
+            picks = parse_selection(console.input("Select track indices to add (e.g. 0-2,4): "), len(results))
+            selected.extend(results[i] for i in picks if results[i].uri)
+            console.print(f"[dim]{len(selected)} track(s) selected[/dim]")
+
+        uris = [t.uri for t in selected]
+        names = selected[0].name if len(selected) == 1 else f"{len(selected)} tracks"
         safe_call(
-            lambda: sp.playlist_add_items(playlist_id, [track_uri]),
-            f"Added [bold]{track_name}[/bold] to playlist [cyan]{playlist_name}[/cyan]"
+            lambda: playlist_add_bulk(playlist_id, uris),
+            f"Added [bold]{names}[/bold] to playlist [cyan]{playlist_name}[/cyan]"
         )
 
     except ValueError as ve:
@@ -526,82 +1178,46 @@ def cmd_add_to_playlist():
 
 def cmd_remove_from_playlist():
     """
-    Remove a track from a selected playlist.
+    Remove tracks from a selected playlist.
 
-    Prompts the user to select a playlist, lists its tracks,
-    and removes the selected track from the playlist.
+    Prompts the user to select a playlist, lists its tracks, and removes
+    the selected positions (e.g. "1-20,35,40") in bulk requests.
     """
     try:
-        pls = sp.current_user_playlists()["items"]
-        if not pls:
-            console.print("[yellow]No playlists found[/yellow]")
+        playlist = select_playlist("Your Playlists")
+        if playlist is None:
             return
 
-        table = Table(title="Your Playlists")
-        table.add_column("Index", style="green")
-        table.add_column("Name", style="yellow")
-        table.add_column("Tracks", style="cyan")
-        for i, p in enumerate(pls):
-            name = p.get("name", "Unknown")
-            total_tracks = str(p.get("tracks", {}).get("total", 0))
-            table.add_row(str(i), name, total_tracks)
-        console.print(table)
-
-        idx_input = console.input("Select playlist index: ").strip()
-        idx = int(idx_input)
-        if not (0 <= idx < len(pls)):
-            raise ValueError("Playlist index out of range")
-
-        playlist = pls[idx]
         playlist_id = playlist.get("id")
         playlist_name = playlist.get("name", "Unknown")
         if not playlist_id:
             console.print("[red]Selected playlist is invalid[/red]")
             return
 
-        tracks = []
-        offset = 0
-        limit = 100
-        while True:
-            response = sp.playlist_items(playlist_id, offset=offset, limit=limit)
-            items = response.get("items", [])
-            if not items:
-                break
-            tracks.extend(items)
-            offset += len(items)
-            if len(items) < limit:
-                break
+        snapshot_id = playlist.get("snapshot_id")
+        tracks = fetch_playlist_tracks(playlist_id, snapshot_id, name=playlist_name)
 
         if not tracks:
             console.print("[yellow]Playlist is empty[/yellow]")
             return
 
-        table = Table(title=f"Tracks in {playlist_name}")
-        table.add_column("Index", style="green")
-        table.add_column("Title", style="yellow")
-        table.add_column("Artists", style="cyan")
-        for i, item in enumerate(tracks):
-            track = item.get("track", {})
-            title = track.get("name", "Unknown")
-            artists = ", ".join(a.get("name", "Unknown") for a in track.get("artists", []))
-            table.add_row(str(i), title, artists)
-        console.print(table)
-
-        t_idx_input = console.input("Select track index to remove: ").strip()
-        t_idx = int(t_idx_input)
-        if not (0 <= t_idx < len(tracks)):
-            raise ValueError("Track index out of range")
+        view = playlist_view(tracks, f"Tracks in {playlist_name}", first_index=0)
+        if len(tracks) > view.page_size:
+            console.print("[dim]Browse to find the tracks to remove, then quit the pager with q[/dim]")
+            view.run(console)
+        else:
+            console.print(view.render())
 
-        track = tracks[t_idx].get("track", {})
-        track_uri = track.get("uri")
-        track_name = track.get("name", "Unknown")
-        if not track_uri:
-            console.print("[red]Selected track is invalid[/red]")
+        picks = parse_selection(console.input("Select track indices to remove (e.g. 1-20,35,40): "), len(tracks))
+        picks = [i for i in picks if tracks[i].track.uri]
+        if not picks:
+            console.print("[red]Selected tracks are invalid[/red]")
             return
 
+        names = tracks[picks[0]].track.name if len(picks) == 1 else f"{len(picks)} tracks"
         safe_call(
-            lambda: sp.playlist_remove_all_occurrences_of_items(playlist_id, [track_uri]),
-            f"Removed [bold]{track_name}[/bold] from playlist [cyan]{playlist_name}[/cyan]"
+            lambda: playlist_remove_positions(playlist_id, snapshot_id, tracks, picks),
+            f"Removed [bold]{names}[/bold] from playlist [cyan]{playlist_name}[/cyan]"
         )
 
     except ValueError as ve:
@@ -633,13 +1249,94 @@ def cmd_create_playlist():
         public = public_input == "y"
 
         safe_call(
-            lambda: sp.user_playlist_create(user_id, name, public=public, description=desc),
+            lambda: user_playlists.add(sp.user_playlist_create(user_id, name, public=public, description=desc)),
             f"Playlist [bold green]{name}[/bold green] created successfully!"
         )
 
     except Exception as e:
         console.print(f"[red]Something went wrong: {e}[/red]")
 
+def cmd_sync_library():
+    """
+    Bring every playlist into the local library index for offline search.
+
+    Playlists whose snapshot_id is unchanged are read from the playlist cache,
+    so only new or modified playlists are downloaded.
+    """
+    try:
+        start = time.perf_counter()
+        pls = user_playlists.all(refresh=True)
+        library_index.ensure_loaded()
+        for p in pls:
+            if p.get("id"):
+                fetch_playlist_tracks(p["id"], p.get("snapshot_id"), name=p.get("name"))
+        elapsed = time.perf_counter() - start
+        console.print(
+            f"[green]Indexed {len(library_index)} tracks from {library_index.playlist_count} playlists "
+            f"in {elapsed:.1f}s[/green]"
+        )
+        console.print(f"Search your library offline by starting a query with [cyan]{LIBRARY_PREFIX}[/cyan]")
+
+    except Exception as e:
+        console.print(f"[red]Something went wrong: {e}[/red]")
+
+def cmd_stats():
+    """
+    Display per-command and per-endpoint timing statistics, optionally exporting them.
+    """
+    try:
+        data = metrics.to_dict()
+
+        table = Table(title="Command Statistics")
+        table.add_column("Command", style="bold green")
+        table.add_column("Runs", justify="right")
+        table.add_column("p50 ms", style="cyan", justify="right")
+        table.add_column("p95 ms", style="cyan", justify="right")
+        table.add_column("HTTP", justify="right")
+        table.add_column("Retries", justify="right")
+        table.add_column("Net s", justify="right")
+        table.add_column("Wait s", justify="right")
+        table.add_column("Render s", justify="right")
+        table.add_column("Histogram", style="yellow")
+        for name, c in data["commands"].items():
+            table.add_row(
+                name, str(c["count"]), f"{c['p50_ms']:.0f}", f"{c['p95_ms']:.0f}",
+                str(c["http_calls"]), str(c["retries"]), f"{c['http_s']:.2f}",
+                f"{c['wait_s']:.2f}", f"{c['render_s']:.2f}", metrics.commands[name].sparkline()
+            )
+        console.print(table)
+
+        table = Table(title="API Calls")
+        table.add_column("Endpoint", style="bold green")
+        table.add_column("Calls", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("p50 ms", style="cyan", justify="right")
+        table.add_column("p95 ms", style="cyan", justify="right")
+        table.add_column("Histogram", style="yellow")
+        for name, e in data["endpoints"].items():
+            table.add_row(
+                name, str(e["count"]), str(e["errors"]), f"{e['p50_ms']:.0f}", f"{e['p95_ms']:.0f}",
+                metrics.endpoints[name].sparkline()
+            )
+        console.print(table)
+        console.print(f"[dim]Histogram buckets (s): ≤{', ≤'.join(map(str, BUCKETS))}, more[/dim]")
+        console.print(f"HTTP calls: [cyan]{data['http_calls']}[/cyan]  Retries: [cyan]{data['retries']}[/cyan]")
+        sched = scheduler.to_dict()
+        console.print(
+            "Scheduled calls: " + "  ".join(
+                f"{name} [cyan]{sched['calls'][name]}[/cyan] (waited {sched['wait_s'][name]:.2f}s)" for name in PRIORITY_NAMES
+            )
+            + f"  Shared reads: [cyan]{sched['shared']}[/cyan]  Rate limited: [cyan]{sched['rate_limited']}[/cyan]"
+        )
+
+        path = console.input("Export to file (.json or .prom, blank to skip): ").strip()
+        if path:
+            metrics.export(os.path.expanduser(path))
+            console.print(f"[green]Statistics written to {path}[/green]")
+
+    except Exception as e:
+        console.print(f"[red]Something went wrong: {e}[/red]")
+
 def show_help():
     """
     Display all available commands with descriptions in a table.
@@ -657,6 +1354,48 @@ def show_help():
 
 
 
+# ------------------ Idle prefetching ------------------ #
+def prefetch_playlists():
+    """Fetch the playlist list, one page per step, unless it is already memoized."""
+    if not user_playlists.loaded:
+        # One page at a time, so a command arriving mid-list stops the fetch at the next step.
+        for _ in user_playlists.stream(workers=1):
+            yield
+
+def prefetch_playback():
+    """Refresh the playback state if it is older than the refresh interval."""
+    playback_state.get(max_age=PLAYBACK_REFRESH_INTERVAL)
+    yield
+
+def prefetch_recent_playlists():
+    """
+    Fetch the first page of recently used playlists that changed since they were cached.
+
+    A playlist that fits in one page is cached outright; for longer ones the
+    page is kept for the next playlist_items_source call.
+    """
+    if not user_playlists.loaded:
+        return
+    by_id = {p.get("id"): p for p in user_playlists.all()}
+    for playlist_id in reversed(list(recent_playlists)):
+        playlist = by_id.get(playlist_id)
+        snapshot_id = (playlist or {}).get("snapshot_id")
+        if not snapshot_id or (playlist_id, snapshot_id) in prefetched_pages:
+            continue
+        if playlist_cache.view(playlist_id, snapshot_id) is not None:
+            continue
+        page = playlist_page_fetcher(playlist_id)(0, 100)
+        if (page.get("total") or 0) <= len(page["items"]):
+            stored = playlist_cache.store(playlist_id, snapshot_id, page["items"], name=playlist.get("name"))
+            library_index.update_playlist(playlist_id, snapshot_id, stored)
+        else:
+            while len(prefetched_pages) >= PREFETCH_PLAYLISTS:
+                prefetched_pages.pop(next(iter(prefetched_pages)))
+            prefetched_pages[(playlist_id, snapshot_id)] = page
+        yield
+
+prefetcher = Prefetcher([prefetch_playlists, prefetch_playback, prefetch_recent_playlists], idle_delay=PREFETCH_DELAY)
+
 # ------------------ Command dictionary ------------------ #
 COMMANDS = {
     "next": cmd_next,
@@ -678,6 +1417,8 @@ COMMANDS = {
     "t": cmd_play_track_and_show_current,
     "show": current_track,
     "s": current_track,
+    "live": cmd_live,
+    "lv": cmd_live,
     "showlists": cmd_list_playlists,
     "sls": cmd_list_playlists,
     "showlist": cmd_show_playlist_tracks,
@@ -690,29 +1431,412 @@ COMMANDS = {
     "atl": cmd_add_to_playlist,
     "removefromlist": cmd_remove_from_playlist,
     "rfl": cmd_remove_from_playlist,
+    "synclib": cmd_sync_library,
+    "sy": cmd_sync_library,
+    "stats": cmd_stats,
     "help": show_help,
     "h": show_help,
     "quit": exit,
     "q": exit
 }
 
+# Canonical (first listed) name of each command, used to label statistics.
+COMMAND_NAMES = {}
+for _name, _func in COMMANDS.items():
+    COMMAND_NAMES.setdefault(_func, _name)
+
+# Commands that can run while coalesced mutations are still pending; any other
+# command sends them first so its effects stay in order.
+COALESCED_COMMANDS = {cmd_next, cmd_prev, cmd_volume, cmd_shuffle, cmd_repeat, current_track, show_help}
+
 # ------------------ Main Loop ------------------ #
+BANNER = "[bold cyan]Spotify Controller[/bold cyan]\nType a command (help to list)"
+
+def run_command(cmd: str):
+    """
+    Dispatch a single command from the COMMANDS dictionary.
+
+    Parameters:
+        cmd (str): Command name or alias.
+
+    Returns:
+        None
+    """
+    prefetcher.cancel()
+    report_queue_errors()
+    if COMMANDS.get(cmd) not in COALESCED_COMMANDS:
+        report_queue_errors(command_queue.flush())
+    if cmd in COMMANDS:
+        with metrics.command(COMMAND_NAMES[COMMANDS[cmd]], console):
+            COMMANDS[cmd]()
+    else:
+        console.print(f"[red]Unknown command:[/red] {cmd}")
+
+    # Only poll or prefetch in the background once a foreground command has authenticated.
+    if sp.loaded:
+        playback_state.start()
+        if PREFETCH_ENABLED:
+            prefetcher.idle()
+
+def resolve_playlist(ref: str):
+    """
+    Find one of the user's playlists by ID, URI, URL or (case-insensitive) name.
+
+    Parameters:
+        ref (str): Playlist reference from a batch line.
+
+    Returns:
+        dict: The playlist; a bare {"id": ...} for a URI or URL of a playlist the user doesn't own.
+
+    Raises:
+        BatchError: If no playlist matches.
+    """
+    from batch import BatchError
+
+    wanted = ref.casefold()
+    for p in user_playlists.all():
+        if ref in (p.get("id"), p.get("uri")) or (p.get("name") or "").casefold() == wanted:
+            return p
+    if ref.startswith("spotify:playlist:") or "open.spotify.com/playlist/" in ref:
+        playlist_id = ref.rstrip("/").replace(":", "/").split("/")[-1].split("?")[0]
+        return {"id": playlist_id, "name": ref}
+    raise BatchError(f"no playlist matches {ref!r}")
+
+# Batch commands sent through the command queue, with their messages.
+QUEUED_BATCH_COMMANDS = {
+    "next": "Skipped to next track",
+    "prev": "Went back to previous track",
+    "volume": "Volume set to {}%",
+    "shuffle": "Shuffle set to {}",
+    "repeat": "Repeat set to {}",
+}
+
+def flush_batch_queue() -> bool:
+    """
+    Send the queued mutations and print any that failed.
+
+    Returns:
+        bool: True if nothing failed.
+    """
+    errors = command_queue.flush() + command_queue.take_errors()
+    for op, e in errors:
+        console.print(f"[red]queued {op.kind} failed: {getattr(e, 'msg', None) or e}[/red]")
+    return not errors
+
+def run_batch_op(op):
+    """
+    Run one (possibly coalesced) batch operation without prompting.
+
+    Parameters:
+        op (BatchOp): Operation from batch.coalesce.
+
+    Returns:
+        str: Summary of what was done.
+    """
+    from batch import chunks
+
+    if op.name in QUEUED_BATCH_COMMANDS:
+        errors = queue_playback_change(op.name, op.args[0] if op.args else None)
+        if errors:
+            raise errors[0][1]
+        return QUEUED_BATCH_COMMANDS[op.name].format(*op.args)
+    if op.name == "pause":
+        sp.pause_playback()
+        return "Playback paused"
+    if op.name == "resume":
+        sp.start_playback()
+        return "Playback resumed"
+    if op.name == "play":
+        if len(op.args) == 1 and ":track:" not in op.args[0] and "/track/" not in op.args[0]:
+            sp.start_playback(context_uri=op.args[0])
+        else:
+            sp.start_playback(uris=op.args)
+        return f"Playing {', '.join(op.args)}"
+    if op.name == "queue":
+        for uri in op.args:
+            sp.add_to_queue(uri)
+        return f"Queued {len(op.args)} track(s)"
+
+    playlist = resolve_playlist(op.args[0])
+    playlist_id, uris = playlist["id"], op.args[1:]
+    if op.name == "add-to-list":
+        requests_made = playlist_add_bulk(playlist_id, uris)
+    else:
+        requests_made = 0
+        for chunk in chunks(uris):
+            result = sp.playlist_remove_all_occurrences_of_items(playlist_id, chunk)
+            # The number of removed occurrences isn't reported; the next listing corrects the total.
+            user_playlists.note_change(playlist_id, (result or {}).get("snapshot_id"))
+            requests_made += 1
+    verb = "Added" if op.name == "add-to-list" else "Removed"
+    return f"{verb} {len(uris)} track(s) {'to' if verb == 'Added' else 'from'} {playlist.get('name', playlist_id)} in {requests_made} request(s)"
+
+def run_batch(lines, defer: bool = False) -> int:
+    """
+    Run batch commands without prompts, merging adjacent playlist edits into bulk requests.
+
+    Nothing is run if any line fails to parse. A failing operation is reported
+    and the remaining ones still run. Skips and playback settings go through
+    the command queue, which merges them and sends them before the next
+    command that isn't queued, or at the end.
+
+    Parameters:
+        lines (iterable): Batch script lines, see batch.BATCH_COMMANDS.
+        defer (bool): Leave queued mutations to the coalescing window instead of
+            sending them at the end, so later calls can still merge with them.
+
+    Returns:
+        int: Exit status: 0 on success, 1 if an operation failed, 2 on parse errors.
+    """
+    from batch import BATCH_COMMANDS, BatchError, coalesce, parse_script
+
+    ops, errors = parse_script(lines)
+    if errors:
+        for error in errors:
+            console.print(f"[red]{error}[/red]")
+        console.print("[dim]Commands: " + "; ".join(usage for _, _, usage in BATCH_COMMANDS.values()) + "[/dim]")
+        return 2
+
+    from spotipy.exceptions import SpotifyException
+
+    resolved = {}
+
+    def playlist_key(ref):
+        if ref not in resolved:
+            try:
+                resolved[ref] = resolve_playlist(ref)["id"]
+            except (SpotifyException, BatchError):
+                resolved[ref] = ref
+        return resolved[ref]
+
+    status = 0
+    for op in coalesce(ops, playlist_key):
+        if op.name not in QUEUED_BATCH_COMMANDS and not flush_batch_queue():
+            status = 1
+        where = f"line {op.lines[0]}" if len(op.lines) == 1 else f"lines {op.lines[0]}-{op.lines[-1]}"
+        with metrics.command(f"batch:{op.name}", console):
+            try:
+                console.print(f"[green]{where}: {run_batch_op(op)}[/green]")
+            except (SpotifyException, BatchError) as e:
+                console.print(f"[red]{where}: {op.name} failed: {getattr(e, 'msg', None) or e}[/red]")
+                status = 1
+    if not defer and not flush_batch_queue():
+        status = 1
+    return status
+
+def show_json(playback) -> dict:
+    """
+    Describe the playback state for `spotuify show --json`.
+
+    Returns:
+        dict: get_current_track's fields plus the track's uri, or
+        {"is_playing": False} when nothing is playing.
+    """
+    track = get_current_track(playback)
+    if not track:
+        return {"is_playing": False}
+    return {**track, "uri": playback["item"].get("uri")}
+
+def run_daemon():
+    """
+    Serve commands from the spotuify client on a Unix socket until stopped.
+
+    The daemon keeps the authenticated client, its connection pool and all
+    caches for its whole lifetime, so a forwarded command only pays for its
+    own API requests. Commands are run one at a time; each one prints to a
+    console of its own whose output is sent back to the client.
+    """
+    import io
+    import shlex
+    import signal
+    from daemon import DaemonServer
+
+    base_console = console
+    command_lock = threading.Lock()
+
+    def handle(request):
+        global console
+        args = request["args"]
+        name = args[0].lower() if args else ""
+        color = bool(request.get("color"))
+        out = io.StringIO()
+        data = None
+        with command_lock, scheduler.priority(INTERACTIVE):
+            prefetcher.cancel()
+            console = TimedConsole(file=out, width=request.get("width") or 80, force_terminal=color, color_system="standard" if color else None)
+            try:
+                report_queue_errors()
+                if name in ("show", "s"):
+                    with metrics.command("daemon:show", console):
+                        playback_state.get(max_age=PLAYBACK_REFRESH_INTERVAL)
+                        playback = playback_state.live()
+                        if request.get("json"):
+                            data = show_json(playback)
+                        else:
+                            current_track(playback)
+                    status = 0
+                elif name == "ping":
+                    data = {"pid": os.getpid()}
+                    console.print(f"spotuify daemon running (pid {os.getpid()})")
+                    status = 0
+                elif name == "stop":
+                    flush_batch_queue()
+                    console.print("Stopping the daemon")
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    return {"status": 0, "output": out.getvalue()}
+                else:
+                    # Queued mutations wait for the coalescing window, so that
+                    # e.g. a burst of `spotuify next` becomes one skip burst.
+                    status = run_batch([shlex.join(args)], defer=True)
+                    # Let the refresher confirm what the command changed; queued
+                    # changes are confirmed when the queue is sent.
+                    if not command_queue:
+                        playback_state.update()
+            finally:
+                console = base_console
+                if PREFETCH_ENABLED:
+                    prefetcher.idle()
+        response = {"status": status, "output": out.getvalue()}
+        if data is not None:
+            response["data"] = data
+        return response
+
+    # Log in up front, in the foreground, so no forwarded command ever waits on OAuth.
+    try:
+        user = sp.me()
+    except Exception as e:
+        console.print(f"[red]Could not log in to Spotify: {e}[/red]")
+        sys.exit(1)
+    try:
+        server = DaemonServer(handle)
+    except (RuntimeError, OSError) as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(1)
+
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    playback_state.start()
+    if PREFETCH_ENABLED:
+        prefetcher.idle()
+    console.print(f"[green]Logged in as {user.get('display_name') or user.get('id')}; listening on {server.path}[/green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        playback_state.stop()
+
+def run_one_shot(args) -> int:
+    """
+    Run one command given on the command line, e.g. `spotuify next` or `spotuify show --json`.
+
+    The command is forwarded to the daemon when one is listening, so it runs on
+    the daemon's warm client; otherwise it is run in this process.
+
+    Parameters:
+        args (list): Command words, optionally including --json.
+
+    Returns:
+        int: Exit status of the command.
+    """
+    from spotuify import forward
+
+    status = forward(args)
+    if status is not None:
+        return status
+
+    as_json = "--json" in args
+    args = [a for a in args if a != "--json"]
+    name = args[0].lower()
+    if name in ("show", "s"):
+        playback_state.get()
+        playback = playback_state.live()
+        if as_json:
+            import json
+            print(json.dumps(show_json(playback)))
+        else:
+            current_track(playback)
+        return 0
+    if name in ("ping", "stop"):
+        console.print("[red]No daemon is running[/red]")
+        return 3
+
+    import shlex
+    return run_batch([shlex.join(args)])
+
+def run_dashboard():
+    """
+    Run the controller in dashboard mode, with fixed header, now-playing,
+    output and prompt regions that are repainted only when they change.
+    """
+    global console
+    from dashboard import Dashboard
+    from rich.console import Group
+
+    def header(width, height):
+        title = title_renderable(width, height)
+        banner = Panel(BANNER, expand=False)
+        return Group(title, banner) if title is not None else banner
+
+    def now_playing():
+        playback = playback_state.live()
+        return now_playing_panel(get_current_track(playback) if playback else None)
+
+    base_console = console
+    dashboard = Dashboard(base_console, header, now_playing, refresh_per_second=DASHBOARD_FPS)
+    console = dashboard.console
+    try:
+        with dashboard:
+            while True:
+                cmd = console.input("Command: ").strip().lower()
+                console.clear()
+                console.print("Command: " + cmd)
+                run_command(cmd)
+                dashboard.refresh(force=True)
+    finally:
+        console = base_console
+
 def main():
+    if "--profile-startup" in sys.argv[1:]:
+        from startup_profile import profile_startup
+        profile_startup(Path(__file__), console)
+        return
+
+    if "--dashboard" in sys.argv[1:]:
+        run_dashboard()
+        return
+
+    if "--daemon" in sys.argv[1:]:
+        run_daemon()
+        return
+
+    if "--batch" in sys.argv[1:]:
+        args = sys.argv[sys.argv.index("--batch") + 1:]
+        source = args[0] if args else "-"
+        if source == "-":
+            sys.exit(run_batch(sys.stdin))
+        with open(source, "r", encoding="utf-8") as f:
+            sys.exit(run_batch(f))
+
+    if len(sys.argv) > 1 and not sys.argv[1].startswith("-"):
+        sys.exit(run_one_shot(sys.argv[1:]))
+
     console.clear()
     print_title(console)
-    console.print(Panel("[bold cyan]Spotify Controller[/bold cyan]\nType a command (help to list)", expand=False))
-    
+    console.print(Panel(BANNER, expand=False))
+
+    if "--startup-probe" in sys.argv[1:]:
+        print(f"STARTUP_PROBE first_prompt_ms={(time.perf_counter() - _STARTUP_T0) * 1000:.1f}", file=sys.stderr)
+        return
+
     while True:
         cmd = console.input("Command: ").strip().lower()
         console.clear()
         
         print_title(console)
-        console.print(Panel("[bold cyan]Spotify Controller[/bold cyan]\nType a command (help to list)", expand=False))
+        console.print(Panel(BANNER, expand=False))
         console.print("Command: " + cmd)
-        if cmd in COMMANDS:
-            COMMANDS[cmd]()
-        else:
-            console.print(f"[red]Unknown command:[/red] {cmd}")
+        run_command(cmd)
 
 if __name__ == "__main__":
     main()
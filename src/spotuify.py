@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Thin client for the controller daemon.
+
+    spotuify next
+    spotuify volume 40
+    spotuify show --json
+
+Each command is forwarded over the daemon's Unix socket, so it runs on the
+daemon's already authenticated client and warm caches. Only the standard
+library is imported here to keep the client's own startup short. When no
+daemon is running, the command is run by a full controller process instead.
+"""
+import json
+import os
+import sys
+
+from daemon import UNIX_SOCKETS, send_request
+
+CONTROLLER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "spotify_controller.py")
+
+
+def terminal_width() -> int:
+    # os.get_terminal_size instead of shutil's, which pulls in the compression modules.
+    try:
+        return int(os.getenv("COLUMNS") or os.get_terminal_size(sys.stdout.fileno()).columns)
+    except (OSError, ValueError):
+        return 80
+
+
+def forward(args):
+    """
+    Send a one-shot command to the daemon and print its output.
+
+    Parameters:
+        args (list): Command words, optionally including --json.
+
+    Returns:
+        int or None: The command's exit status, or None if no daemon could be reached.
+    """
+    if not UNIX_SOCKETS:
+        return None
+    as_json = "--json" in args
+    args = [a for a in args if a != "--json"]
+    request = {
+        "args": args,
+        "json": as_json,
+        "color": sys.stdout.isatty() and not as_json and not os.getenv("NO_COLOR"),
+        "width": terminal_width(),
+    }
+    try:
+        response = send_request(request)
+    except OSError:
+        return None
+
+    if as_json:
+        print(json.dumps(response.get("data", {"status": response.get("status"), "output": response.get("output", "")})))
+    else:
+        sys.stdout.write(response.get("output", ""))
+    return response.get("status", 0)
+
+
+def main(argv=None) -> int:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] in ("-h", "--help"):
+        print(__doc__.strip())
+        return 0 if args else 2
+    if not UNIX_SOCKETS:
+        print("spotuify: the daemon needs Unix domain sockets, which this platform doesn't support.", file=sys.stderr)
+        print("Run the command with: python spotify_controller.py " + " ".join(args), file=sys.stderr)
+        return 3
+
+    status = forward(args)
+    if status is not None:
+        return status
+    if os.path.exists(CONTROLLER):
+        # No daemon: run the command in a full controller process (which loads site-packages).
+        os.execv(sys.executable, [sys.executable, CONTROLLER, *args])
+    print("spotuify: no daemon is running. Start it with: python spotify_controller.py --daemon", file=sys.stderr)
+    return 3
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+import time
+
+from rich.table import Table
+
+PROBE_FLAG = "--startup-probe"
+PROBE_MARKER = "STARTUP_PROBE first_prompt_ms="
+DEFERRED_MODULES = ("dotenv", "spotipy", "transport")
+
+
+def parse_importtime(stderr: str):
+    """
+    Aggregate `python -X importtime` output by top-level import.
+
+    Parameters:
+        stderr (str): Captured stderr of a process run with -X importtime.
+
+    Returns:
+        list: (module, cumulative_ms) tuples for imports made at the top level, slowest first.
+    """
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        module = name.strip()
+        totals[module] = totals.get(module, 0) + int(cumulative) / 1000
+    return sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
+
+
+def profile_startup(script_path, console, top: int = 15):
+    """
+    Report an import-time breakdown and the time to the first prompt.
+
+    The controller is started in a subprocess with -X importtime and a probe
+    flag that makes it exit right before the first prompt. If the
+    SPOTUIFY_STARTUP_BUDGET_MS variable is set and the time to first prompt
+    exceeds it, the process exits with status 1.
+
+    Parameters:
+        script_path (Path): Path to spotify_controller.py.
+        console (Console): Rich Console instance for printing.
+        top (int): Number of imports to list.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script_path), PROBE_FLAG],
+        capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    first_prompt_ms = None
+    for line in result.stderr.splitlines():
+        if line.startswith(PROBE_MARKER):
+            first_prompt_ms = float(line[len(PROBE_MARKER):])
+    if first_prompt_ms is None:
+        console.print(f"[red]Startup probe failed:[/red]\n{result.stderr[-2000:]}")
+        sys.exit(1)
+
+    imports = parse_importtime(result.stderr)
+    import_total = sum(ms for _, ms in imports)
+    table = Table(title="Startup Imports")
+    table.add_column("Module", style="yellow")
+    table.add_column("Cumulative (ms)", style="cyan", justify="right")
+    table.add_column("Share", style="green", justify="right")
+    for module, ms in imports[:top]:
+        table.add_row(module, f"{ms:.1f}", f"{ms / import_total:.0%}" if import_total else "-")
+    console.print(table)
+
+    deferred = Table(title="Deferred Until First Command")
+    deferred.add_column("Module", style="yellow")
+    deferred.add_column("Import (ms)", style="cyan", justify="right")
+    for module in DEFERRED_MODULES:
+        t0 = time.perf_counter()
+        __import__(module)
+        deferred.add_row(module, f"{(time.perf_counter() - t0) * 1000:.1f}")
+    console.print(deferred)
+
+    console.print(f"Imports at startup: [cyan]{import_total:.1f} ms[/cyan]")
+    console.print(f"Time to first prompt (in process): [cyan]{first_prompt_ms:.1f} ms[/cyan]")
+    console.print(f"Time to first prompt (incl. interpreter): [cyan]{wall_ms:.1f} ms[/cyan]")
+
+    budget = os.getenv("SPOTUIFY_STARTUP_BUDGET_MS")
+    if budget and first_prompt_ms > float(budget):
+        console.print(f"[red]Startup exceeded budget of {float(budget):.0f} ms[/red]")
+        sys.exit(1)
@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+from spotipy.cache_handler import CacheHandler
+
+
+class TokenStore(CacheHandler):
+    """
+    spotipy cache handler that keeps the token in memory.
+
+    The cache file is read once, on the first lookup, instead of on every
+    request. It is only written when the token actually changes, through a
+    temporary file that replaces it atomically, so a crash or a concurrent
+    read never sees a half-written token. The temporary file is created
+    with owner-only permissions.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._token = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.changed = threading.Event()
+        self.writes = 0
+
+    def get_cached_token(self):
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._token = json.load(f)
+                except (OSError, ValueError):
+                    self._token = None
+            return self._token
+
+    def save_token_to_cache(self, token_info):
+        with self._lock:
+            if token_info == self._token:
+                return
+            self._token = token_info
+            self._loaded = True
+            try:
+                self._write(token_info)
+            except OSError:
+                pass
+        self.changed.set()
+
+    def _write(self, token_info):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".token-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(token_info, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.writes += 1
+
+
+class TokenRefresher:
+    """
+    Background thread that refreshes the access token before it expires.
+
+    spotipy refreshes a token inside the first request made less than a
+    minute before expiry. Refreshing `margin` seconds ahead on this thread
+    means a command never pays for that round trip; if a background refresh
+    fails it is retried, and spotipy's own refresh remains the fallback.
+    """
+
+    def __init__(self, auth_manager, store: TokenStore, margin: float = 300.0, retry_delay: float = 30.0):
+        """
+        Parameters:
+            auth_manager (SpotifyOAuth): Manager whose cache_handler is `store`.
+            store (TokenStore): Where the current token lives.
+            margin (float): Seconds before expiry to refresh.
+            retry_delay (float): Seconds to wait after a failed refresh.
+        """
+        self._auth_manager = auth_manager
+        self._store = store
+        self.margin = margin
+        self.retry_delay = retry_delay
+        self._stop = threading.Event()
+        self._thread = None
+        self.refreshes = 0
+        self.failures = 0
+
+    def start(self):
+        """Start the refresher thread if it is not already running."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="token-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._store.changed.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            token = self._store.get_cached_token()
+            if not token or not token.get("refresh_token"):
+                # Nothing to refresh until the first login saves a token.
+                self._store.changed.wait()
+                self._store.changed.clear()
+                continue
+            # Never aim earlier than halfway through a token's lifetime, so a short-lived
+            # token can't make the thread refresh in a loop.
+            margin = min(self.margin, token.get("expires_in", 3600) / 2)
+            delay = token.get("expires_at", 0) - margin - time.time()
+            if delay > 0:
+                # A token saved in the meantime (e.g. refreshed by a request) reschedules the wait.
+                if self._store.changed.wait(delay):
+                    self._store.changed.clear()
+                continue
+            try:
+                self._auth_manager.refresh_access_token(token["refresh_token"])
+                self.refreshes += 1
+            except Exception:
+                self.failures += 1
+                self._stop.wait(self.retry_delay)
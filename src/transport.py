@@ -0,0 +1,116 @@
+import random
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Methods safe to resend after the server may already have acted on them.
+# Anything else (POST: skips, queue adds) is only retried when it cannot have
+# been applied: on a connection error or a 429.
+IDEMPOTENT_METHODS = frozenset(["GET", "PUT", "DELETE"])
+MAX_RETRY_AFTER = 30.0
+
+_listeners = []
+
+
+def add_listener(listener):
+    """
+    Register a callable notified of every HTTP response and retry.
+
+    The listener is called as listener(event, **info) with event "response"
+    (info: status, seconds, url) or "retry" (info: url, and the status of
+    the response being retried, or None after a connection error).
+    """
+    _listeners.append(listener)
+
+
+def notify(event: str, **info):
+    """Send a transport event to every registered listener."""
+    for listener in _listeners:
+        try:
+            listener(event, **info)
+        except Exception:
+            pass
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry that honours Retry-After on 429 and adds full jitter to backoff.
+
+    Retry-After values above MAX_RETRY_AFTER are capped so a long rate-limit
+    window cannot freeze the terminal. Methods outside allowed_methods are
+    still retried on 429, which the server rejects without acting on.
+    """
+
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and self.status_forcelist and 429 in self.status_forcelist:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        new_retry = super().increment(method, url, *args, **kwargs)
+        response = kwargs.get("response")
+        notify("retry", url=url, status=response.status if response is not None else None)
+        return new_retry
+
+    def parse_retry_after(self, retry_after):
+        return min(super().parse_retry_after(retry_after), MAX_RETRY_AFTER)
+
+
+def retry_delay(attempt: int, backoff_factor: float, retry_after=None) -> float:
+    """
+    Compute the wait before retrying a failed request.
+
+    Parameters:
+        attempt (int): Number of attempts already made (1 for the first retry).
+        backoff_factor (float): Base delay in seconds, doubled on each attempt.
+        retry_after (str, optional): Value of the response's Retry-After header.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return random.uniform(0, backoff_factor * (2 ** (attempt - 1)))
+
+
+def build_session(pool_size: int = 10, max_retries: int = 3, backoff_factor: float = 0.3):
+    """
+    Build a pooled keep-alive requests session with retrying transport.
+
+    Parameters:
+        pool_size (int): Number of keep-alive connections kept per host.
+        max_retries (int): Retries for connection errors, 429 and transient 5xx.
+        backoff_factor (float): Base for the jittered exponential backoff.
+
+    Returns:
+        requests.Session: Session to pass to spotipy.Spotify(requests_session=...).
+    """
+    retry = JitteredRetry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.hooks["response"].append(
+        lambda response, *args, **kwargs: notify(
+            "response", status=response.status_code, seconds=response.elapsed.total_seconds(), url=response.url
+        )
+    )
+    return session
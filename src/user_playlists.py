@@ -0,0 +1,92 @@
+import threading
+
+from pagination import iter_pages
+
+
+class UserPlaylists:
+    """
+    Session memo of the current user's playlists, fetched page by page.
+
+    The first stream() pages through the whole list and yields each page as
+    soon as it arrives, so callers can render rows before the last page is in.
+    Once a stream completes, the list is kept for the rest of the session and
+    later streams yield it in one go without a request. Writes made through
+    the controller are applied to the memo with note_change() and add().
+    """
+
+    def __init__(self, fetch_page, page_size: int = 50, workers: int = 4):
+        """
+        Parameters:
+            fetch_page (callable): Called as fetch_page(offset, limit), e.g. wrapping
+                sp.current_user_playlists.
+            page_size (int): Playlists per request (Spotify allows at most 50).
+            workers (int): Maximum number of pages requested at the same time.
+        """
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._workers = workers
+        self._items = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the full list is memoized."""
+        return self._items is not None
+
+    def stream(self, refresh: bool = False, workers: int = None):
+        """
+        Yield the user's playlists page by page.
+
+        Parameters:
+            refresh (bool): Fetch the list again even if it is memoized.
+            workers (int, optional): Overrides the pages requested at the same time.
+                With 1, each page is only requested when the previous one is consumed,
+                so a caller that stops iterating stops the fetch.
+
+        Returns:
+            generator: Lists of playlist dicts, in Spotify's order.
+        """
+        items = self._items
+        if items is not None and not refresh:
+            yield list(items)
+            return
+
+        fetched = []
+        for page in iter_pages(self._fetch_page, self._page_size, workers or self._workers):
+            fetched.extend(page)
+            yield page
+        with self._lock:
+            self._items = fetched
+
+    def all(self, refresh: bool = False) -> list:
+        """Return every playlist, fetching the remaining pages if needed."""
+        return [p for page in self.stream(refresh) for p in page]
+
+    def invalidate(self):
+        """Forget the memoized list so the next stream fetches it again."""
+        with self._lock:
+            self._items = None
+
+    def add(self, playlist: dict):
+        """Record a newly created playlist; Spotify lists the newest first."""
+        with self._lock:
+            if self._items is not None and playlist:
+                self._items.insert(0, playlist)
+
+    def note_change(self, playlist_id: str, snapshot_id: str = None, delta: int = 0):
+        """
+        Apply a write made to a playlist to its memoized entry.
+
+        Parameters:
+            playlist_id (str): Spotify playlist ID.
+            snapshot_id (str, optional): snapshot_id returned by the write; when
+                unknown the entry's snapshot is cleared so it is looked up again.
+            delta (int): Change in the playlist's track count.
+        """
+        with self._lock:
+            for playlist in self._items or []:
+                if playlist.get("id") == playlist_id:
+                    playlist["snapshot_id"] = snapshot_id
+                    tracks = playlist.setdefault("tracks", {})
+                    tracks["total"] = max(0, (tracks.get("total") or 0) + delta)
+                    break